@@ -0,0 +1,201 @@
+import math
+import threading
+import time
+from collections import Counter, OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable
+
+from django.http import HttpRequest, HttpResponse
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError('Token bucket rate must be positive')
+
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._clock: Callable[[], float] = clock
+        self._tokens: float = capacity
+        self._updated: float = clock()
+
+    def _refill(self) -> None:
+        now: float = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        self._refill()
+        if self._tokens < tokens:
+            return False
+
+        self._tokens -= tokens
+        return True
+
+    def retry_after(self, tokens: float = 1) -> float:
+        self._refill()
+        return max(0.0, (tokens - self._tokens) / self.rate)
+
+
+class RateLimiter:
+    """Token bucket per client, least recently seen clients are forgotten when there are too many of them"""
+
+    def __init__(self, rate: float, capacity: float, max_clients: int = 10000,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.max_clients: int = max_clients
+        self._clock: Callable[[], float] = clock
+        self._buckets: OrderedDict[Hashable, TokenBucket] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get_bucket(self, client: Hashable) -> TokenBucket:
+        bucket: TokenBucket | None = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = TokenBucket(self.rate, self.capacity, self._clock)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+
+        return bucket
+
+    def try_acquire(self, client: Hashable) -> tuple[bool, float]:
+        """Returns whether request is admitted and, if not, in how many seconds it can be retried"""
+        with self._lock:
+            bucket: TokenBucket = self._get_bucket(client)
+            if bucket.try_acquire():
+                return True, 0.0
+            return False, bucket.retry_after()
+
+
+class _Call:
+    def __init__(self):
+        self.done: threading.Event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class Coalescer:
+    """Concurrent calls with the same key share single execution of the first one"""
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = dict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def run(self, key: Hashable, function: Callable[[], Any]) -> tuple[Any, bool]:
+        """Returns result of the function and whether it was shared with another caller"""
+        with self._lock:
+            call: _Call | None = self._calls.get(key)
+            leader: bool = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, False
+
+
+class Counters:
+    def __init__(self):
+        self._counter: Counter = Counter()
+        self._lock: threading.Lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counter[name] += value
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counter)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counter.clear()
+
+
+class Admission:
+    """
+    In-process admission control of the expensive views: per client rate limits, request body size cap,
+    array elements and batch operations count caps and coalescing of identical concurrent operations
+    """
+
+    def __init__(self, rate: float, burst: float, max_body_size: int, max_elements: int,
+                 max_batch_operations: int = 100, clock: Callable[[], float] = time.monotonic):
+        self.max_body_size: int = max_body_size
+        self.max_elements: int = max_elements
+        self.max_batch_operations: int = max_batch_operations
+        self.limiter: RateLimiter = RateLimiter(rate, burst, clock=clock)
+        self.coalescer: Coalescer = Coalescer()
+        self.counters: Counters = Counters()
+
+    @classmethod
+    def from_settings(cls) -> 'Admission':
+        from django.conf import settings
+        from django.core.exceptions import ImproperlyConfigured
+
+        rate: float = getattr(settings, 'ARRAYS_RATE_LIMIT', 5)
+        if rate <= 0:
+            raise ImproperlyConfigured('ARRAYS_RATE_LIMIT must be positive, set it very high to turn limits off')
+
+        return cls(
+            rate=rate,
+            burst=getattr(settings, 'ARRAYS_RATE_BURST', 20),
+            max_body_size=getattr(settings, 'ARRAYS_MAX_BODY_SIZE', 64 * 1024),
+            max_elements=getattr(settings, 'ARRAYS_MAX_ELEMENTS', 10000),
+            max_batch_operations=getattr(settings, 'ARRAYS_MAX_BATCH_OPERATIONS', 100),
+        )
+
+    @staticmethod
+    def get_client(request: HttpRequest) -> str:
+        return request.META.get('REMOTE_ADDR', '')
+
+    def rate_limited(self, view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args, **kwargs):
+            admitted, retry_after = self.limiter.try_acquire(self.get_client(request))
+            if not admitted:
+                self.counters.increment('rate_limited')
+                response: HttpResponse = HttpResponse('Too many requests', status=429, content_type='text/plain')
+                response['Retry-After'] = str(math.ceil(retry_after))
+                return response
+
+            self.counters.increment('admitted')
+            return view(request, *args, **kwargs)
+
+        return wrapper
+
+    def body_limited(self, view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args, **kwargs):
+            try:
+                content_length: int = int(request.META.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                content_length = 0
+
+            if content_length > self.max_body_size:
+                self.counters.increment('body_too_large')
+                return HttpResponse('Request body is too large', status=413, content_type='text/plain')
+
+            return view(request, *args, **kwargs)
+
+        return wrapper
+
+    def coalesce(self, key: str, function: Callable[[], Any]) -> Any:
+        result, shared = self.coalescer.run(key, function)
+        self.counters.increment(f'coalesced_{key}' if shared else f'executed_{key}')
+        return result
@@ -0,0 +1,233 @@
+import json
+import math
+from numbers import Number
+from typing import Any, Callable
+
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+
+from .api_encoding import (CODECS, BodyTooLarge, Codec, JsonCodec, MsgpackCodec, NotAcceptable, UnsupportedMediaType,
+                           compress, decompress, get_codec, negotiate_codec, negotiate_encoding)
+from .typed_arrays import TypedArray
+from .views import ADMISSION, ARRAY_MANAGER, run_process_arrays
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status: int = status
+        self.message: str = message
+
+
+def serialize_array(array_id: int, array: list) -> dict:
+    # Copy keeps batch results from changing with the following operations, codecs read its buffer directly
+    typed_array: TypedArray = array[:] if isinstance(array, TypedArray) else TypedArray(array)
+    return {
+        'id': array_id,
+        'array': typed_array,
+        'dtype': typed_array.dtype,
+        'nbytes': typed_array.nbytes,
+    }
+
+
+def validate_array(data: Any) -> list[int | float]:
+    if not isinstance(data, dict) or not isinstance(data.get('array'), list):
+        raise ApiError(400, 'Request body must contain "array" list')
+
+    array: list = data['array']
+    if len(array) > ADMISSION.max_elements:
+        ADMISSION.counters.increment('too_many_elements')
+        raise ApiError(413, f'Array can not contain more than {ADMISSION.max_elements} elements')
+
+    if not array:
+        raise ApiError(400, 'Array must not be empty')
+
+    if not all(isinstance(elem, Number) and not isinstance(elem, bool) for elem in array):
+        raise ApiError(400, 'Array elements must be numbers')
+
+    # Ints are always finite and huge ones can not be converted to float
+    if not all(isinstance(elem, int) or math.isfinite(elem) for elem in array):
+        raise ApiError(400, 'Array elements must be finite')
+
+    return array
+
+
+def get_array_id(data: Any) -> int:
+    array_id: Any = data.get('id') if isinstance(data, dict) else None
+    if not isinstance(array_id, int) or isinstance(array_id, bool) or array_id < 0:
+        raise ApiError(400, 'Operation must contain non-negative integer "id"')
+
+    return array_id
+
+
+def list_arrays(data: Any = None) -> tuple[int, dict]:
+    return 200, {'arrays': [serialize_array(i, array) for i, array in enumerate(ARRAY_MANAGER.objects)]}
+
+
+def get_array(data: Any) -> tuple[int, dict]:
+    array_id: int = get_array_id(data)
+    try:
+        return 200, serialize_array(array_id, ARRAY_MANAGER.get(array_id))
+    except IndexError:
+        raise ApiError(404, f'Array {array_id} does not exist')
+
+
+def create_array(data: Any) -> tuple[int, dict]:
+    array: list = ARRAY_MANAGER.create(validate_array(data))
+    return 201, serialize_array(len(ARRAY_MANAGER.objects) - 1, array)
+
+
+def update_array(data: Any) -> tuple[int, dict]:
+    array_id: int = get_array_id(data)
+    try:
+        return 200, serialize_array(array_id, ARRAY_MANAGER.update(array_id, validate_array(data)))
+    except IndexError:
+        raise ApiError(404, f'Array {array_id} does not exist')
+
+
+def delete_array(data: Any) -> tuple[int, None]:
+    array_id: int = get_array_id(data)
+    try:
+        ARRAY_MANAGER.delete(array_id)
+    except IndexError:
+        raise ApiError(404, f'Array {array_id} does not exist')
+    return 204, None
+
+
+def process_arrays(data: Any = None) -> tuple[int, dict]:
+    # Empty arrays can still come from the HTML views and have no last element to compare
+    if not all(ARRAY_MANAGER.objects):
+        raise ApiError(409, 'Arrays can not be processed while some of them are empty')
+
+    run_process_arrays()
+    return list_arrays()
+
+
+OPERATIONS: dict[str, Callable[[Any], tuple[int, Any]]] = {
+    'list': list_arrays,
+    'get': get_array,
+    'create': create_array,
+    'update': update_array,
+    'delete': delete_array,
+    'process': process_arrays,
+}
+
+
+def run_batch(data: Any) -> tuple[int, dict]:
+    """
+    Runs operations one by one in the given order, failed operation does not stop the rest.
+    Whole batch takes single rate limit token, so operations count is capped and only one "process" can run.
+    Keep in mind that "delete" shifts ids of the following arrays
+    """
+    if not isinstance(data, dict) or not isinstance(data.get('operations'), list):
+        raise ApiError(400, 'Request body must contain "operations" list')
+
+    if len(data['operations']) > ADMISSION.max_batch_operations:
+        ADMISSION.counters.increment('too_many_operations')
+        raise ApiError(413, f'Batch can not contain more than {ADMISSION.max_batch_operations} operations')
+
+    results: list[dict] = []
+    processed: bool = False
+    for operation in data['operations']:
+        name: Any = operation.get('op') if isinstance(operation, dict) else None
+        try:
+            if name not in OPERATIONS:
+                raise ApiError(400, f'Unknown operation {name}')
+            if name == 'process':
+                if processed:
+                    raise ApiError(400, 'Batch can contain only one "process" operation')
+                processed = True
+            status, body = OPERATIONS[name](operation)
+        except ApiError as error:
+            status, body = error.status, {'error': error.message}
+
+        results.append({'status': status, 'body': body})
+
+    return 200, {'results': results}
+
+
+def read_body(request: HttpRequest) -> Any:
+    body: bytes = decompress(request.body, request.headers.get('Content-Encoding'), ADMISSION.max_body_size)
+    return get_codec(request.content_type).decode(body)
+
+
+def make_response(request: HttpRequest, codec: Codec, status: int, payload: Any) -> HttpResponse:
+    if payload is None:
+        return HttpResponse(status=status)
+
+    body: bytes = codec.encode(payload)
+    body, encoding = compress(body, negotiate_encoding(request.headers.get('Accept-Encoding')))
+
+    response: HttpResponse = HttpResponse(body, status=status, content_type=codec.media_type)
+    response['Vary'] = 'Accept, Accept-Encoding'
+    if encoding is not None:
+        response['Content-Encoding'] = encoding
+    return response
+
+
+def error_response(status: int, message: str) -> HttpResponse:
+    return HttpResponse(json.dumps({'error': message}), status=status, content_type='application/json')
+
+
+def api_view(handlers: dict[str, Callable[[Any], tuple[int, Any]]], codecs: tuple[Codec, ...] = CODECS):
+    """
+    Makes view that negotiates request and response formats and dispatches it by HTTP method.
+    URL kwargs are merged into decoded request body, so handlers get single dict.
+    Response format is negotiated before handler runs, so unacceptable request changes nothing
+    """
+
+    @csrf_exempt
+    def view(request: HttpRequest, **kwargs) -> HttpResponse:
+        handler: Callable | None = handlers.get(request.method)
+        if handler is None:
+            response: HttpResponse = error_response(405, f'Method {request.method} is not allowed')
+            response['Allow'] = ', '.join(handlers)
+            return response
+
+        try:
+            codec: Codec = negotiate_codec(request.headers.get('Accept'), codecs)
+            data: Any = read_body(request) if request.body else {}
+            if kwargs:
+                if not isinstance(data, dict):
+                    raise ApiError(400, 'Request body must be an object')
+                data = {**data, **kwargs}
+
+            status, payload = handler(data)
+            return make_response(request, codec, status, payload)
+        except NotAcceptable as error:
+            return error_response(406, str(error))
+        except BodyTooLarge as error:
+            ADMISSION.counters.increment('body_too_large')
+            return error_response(413, str(error))
+        except UnsupportedMediaType as error:
+            return error_response(415, str(error))
+        except ValueError as error:
+            return error_response(400, str(error))
+        except ApiError as error:
+            return error_response(error.status, error.message)
+
+    return view
+
+
+def admission_stats(data: Any = None) -> tuple[int, dict]:
+    return 200, {'counters': ADMISSION.counters.snapshot()}
+
+
+def memory_stats(data: Any = None) -> tuple[int, dict]:
+    from .memprofile import PROFILER
+
+    if not PROFILER.enabled:
+        raise ApiError(404, 'Memory profiling is off, set ARRAYS_MEMORY_PROFILING=1 to turn it on')
+    return 200, {'operations': PROFILER.report()}
+
+
+arrays_list = ADMISSION.rate_limited(ADMISSION.body_limited(api_view({'GET': list_arrays, 'POST': create_array})))
+array_detail = ADMISSION.rate_limited(ADMISSION.body_limited(
+    api_view({'GET': get_array, 'PUT': update_array, 'DELETE': delete_array})
+))
+process = ADMISSION.rate_limited(api_view({'POST': process_arrays}))
+batch = ADMISSION.rate_limited(ADMISSION.body_limited(
+    api_view({'POST': run_batch}, codecs=(JsonCodec(), MsgpackCodec()))
+))
+admission = api_view({'GET': admission_stats}, codecs=(JsonCodec(), MsgpackCodec()))
+memory = api_view({'GET': memory_stats}, codecs=(JsonCodec(), MsgpackCodec()))
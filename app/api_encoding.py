@@ -0,0 +1,392 @@
+import gzip
+import json
+import struct
+import zlib
+from typing import Any, NoReturn
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from .typed_arrays import DTYPES, TypedArray
+
+
+COMPRESSION_MIN_SIZE: int = 1024
+
+
+class NotAcceptable(ValueError):
+    pass
+
+
+class UnsupportedMediaType(ValueError):
+    pass
+
+
+class BodyTooLarge(ValueError):
+    pass
+
+
+class Codec:
+    media_types: tuple[str, ...] = ()
+
+    @property
+    def media_type(self) -> str:
+        return self.media_types[0]
+
+    def encode(self, payload: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, body: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    media_types: tuple[str, ...] = ('application/json',)
+
+    def encode(self, payload: Any) -> bytes:
+        return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=self._encode_array).encode()
+
+    def decode(self, body: bytes) -> Any:
+        try:
+            return json.loads(body or b'null', parse_constant=self._reject_constant)
+        except (UnicodeDecodeError, json.JSONDecodeError, RecursionError) as error:
+            raise ValueError(f'Invalid JSON: {error}') from error
+
+    @staticmethod
+    def _encode_array(obj: Any) -> list:
+        if isinstance(obj, TypedArray):
+            return list(obj)
+        raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+    @staticmethod
+    def _reject_constant(constant: str) -> NoReturn:
+        raise ValueError(f'Invalid JSON: {constant} is not allowed')
+
+
+class MsgpackCodec(Codec):
+    """
+    Self-contained MessagePack encoder and decoder for nil, bool, int, float, str, bin, array and map,
+    which is everything the API sends and receives
+    """
+
+    media_types: tuple[str, ...] = ('application/msgpack', 'application/x-msgpack')
+
+    SCALAR_FORMATS: dict[int, str] = {
+        0xca: '>f', 0xcb: '>d',
+        0xcc: '>B', 0xcd: '>H', 0xce: '>I', 0xcf: '>Q',
+        0xd0: '>b', 0xd1: '>h', 0xd2: '>i', 0xd3: '>q',
+    }
+
+    SIZED_FORMATS: dict[int, tuple[str, str]] = {
+        0xc4: ('bin', '>B'), 0xc5: ('bin', '>H'), 0xc6: ('bin', '>I'),
+        0xd9: ('str', '>B'), 0xda: ('str', '>H'), 0xdb: ('str', '>I'),
+        0xdc: ('array', '>H'), 0xdd: ('array', '>I'),
+        0xde: ('map', '>H'), 0xdf: ('map', '>I'),
+    }
+
+    def encode(self, payload: Any) -> bytes:
+        buffer: bytearray = bytearray()
+        self._pack(payload, buffer)
+        return bytes(buffer)
+
+    def decode(self, body: bytes) -> Any:
+        try:
+            payload, offset = self._unpack(body, 0)
+        except (IndexError, struct.error, UnicodeDecodeError, RecursionError) as error:
+            raise ValueError(f'Invalid msgpack: {error}') from error
+        except TypeError as error:
+            # Unhashable map keys, e.g. arrays
+            raise ValueError(f'Invalid msgpack: {error}') from error
+
+        if offset != len(body):
+            raise ValueError('Invalid msgpack: trailing data')
+        return payload
+
+    def _pack(self, obj: Any, buffer: bytearray) -> None:
+        if obj is None:
+            buffer.append(0xc0)
+        elif obj is True:
+            buffer.append(0xc3)
+        elif obj is False:
+            buffer.append(0xc2)
+        elif isinstance(obj, int):
+            self._pack_int(obj, buffer)
+        elif isinstance(obj, float):
+            buffer += struct.pack('>Bd', 0xcb, obj)
+        elif isinstance(obj, str):
+            data: bytes = obj.encode()
+            self._pack_header(len(data), buffer, fix=(0xa0, 32), sized=((0xd9, 'B'), (0xda, 'H'), (0xdb, 'I')))
+            buffer += data
+        elif isinstance(obj, (bytes, bytearray, memoryview)):
+            data: bytes = bytes(obj)
+            self._pack_header(len(data), buffer, fix=None, sized=((0xc4, 'B'), (0xc5, 'H'), (0xc6, 'I')))
+            buffer += data
+        elif isinstance(obj, dict):
+            self._pack_header(len(obj), buffer, fix=(0x80, 16), sized=((0xde, 'H'), (0xdf, 'I')))
+            for key, value in obj.items():
+                self._pack(key, buffer)
+                self._pack(value, buffer)
+        elif hasattr(obj, '__iter__'):
+            items: list = list(obj)
+            self._pack_header(len(items), buffer, fix=(0x90, 16), sized=((0xdc, 'H'), (0xdd, 'I')))
+            for item in items:
+                self._pack(item, buffer)
+        else:
+            raise TypeError(f'Can not pack {type(obj).__name__}')
+
+    @staticmethod
+    def _pack_header(size: int, buffer: bytearray, fix: tuple[int, int] | None,
+                     sized: tuple[tuple[int, str], ...]) -> None:
+        if fix and size < fix[1]:
+            buffer.append(fix[0] | size)
+            return
+
+        for code, fmt in sized:
+            if size < 1 << (8 * struct.calcsize(fmt)):
+                buffer += struct.pack(f'>B{fmt}', code, size)
+                return
+
+        raise ValueError('Object is too large for msgpack')
+
+    @staticmethod
+    def _pack_int(obj: int, buffer: bytearray) -> None:
+        if 0 <= obj < 0x80 or -32 <= obj < 0:
+            buffer += struct.pack('>b' if obj < 0 else '>B', obj)
+        elif obj >= 0:
+            for code, fmt in ((0xcc, 'B'), (0xcd, 'H'), (0xce, 'I'), (0xcf, 'Q')):
+                if obj < 1 << (8 * struct.calcsize(fmt)):
+                    buffer += struct.pack(f'>B{fmt}', code, obj)
+                    return
+            raise OverflowError('Integer is too large for msgpack')
+        else:
+            for code, fmt in ((0xd0, 'b'), (0xd1, 'h'), (0xd2, 'i'), (0xd3, 'q')):
+                if obj >= -(1 << (8 * struct.calcsize(fmt) - 1)):
+                    buffer += struct.pack(f'>B{fmt}', code, obj)
+                    return
+            raise OverflowError('Integer is too small for msgpack')
+
+    def _unpack(self, data: bytes, offset: int) -> tuple[Any, int]:
+        code: int = data[offset]
+        offset += 1
+
+        if code <= 0x7f:
+            return code, offset
+        if code >= 0xe0:
+            return code - 0x100, offset
+        if 0x80 <= code <= 0x8f:
+            return self._unpack_map(data, offset, code & 0x0f)
+        if 0x90 <= code <= 0x9f:
+            return self._unpack_array(data, offset, code & 0x0f)
+        if 0xa0 <= code <= 0xbf:
+            return self._unpack_str(data, offset, code & 0x1f)
+        if code == 0xc0:
+            return None, offset
+        if code in (0xc2, 0xc3):
+            return code == 0xc3, offset
+
+        fmt: str | None = self.SCALAR_FORMATS.get(code)
+        if fmt is not None:
+            return struct.unpack_from(fmt, data, offset)[0], offset + struct.calcsize(fmt)
+
+        sized: tuple[str, str] | None = self.SIZED_FORMATS.get(code)
+        if sized is None:
+            raise ValueError(f'Invalid msgpack: unsupported type 0x{code:02x}')
+
+        kind, fmt = sized
+        size: int = struct.unpack_from(fmt, data, offset)[0]
+        offset += struct.calcsize(fmt)
+        if kind == 'str':
+            return self._unpack_str(data, offset, size)
+        if kind == 'bin':
+            return self._unpack_bin(data, offset, size)
+        if kind == 'array':
+            return self._unpack_array(data, offset, size)
+        return self._unpack_map(data, offset, size)
+
+    @staticmethod
+    def _unpack_bin(data: bytes, offset: int, size: int) -> tuple[bytes, int]:
+        if offset + size > len(data):
+            raise IndexError('unexpected end of data')
+        return data[offset:offset + size], offset + size
+
+    def _unpack_str(self, data: bytes, offset: int, size: int) -> tuple[str, int]:
+        raw, offset = self._unpack_bin(data, offset, size)
+        return raw.decode(), offset
+
+    def _unpack_array(self, data: bytes, offset: int, size: int) -> tuple[list, int]:
+        items: list = []
+        for _ in range(size):
+            item, offset = self._unpack(data, offset)
+            items.append(item)
+        return items, offset
+
+    def _unpack_map(self, data: bytes, offset: int, size: int) -> tuple[dict, int]:
+        result: dict = {}
+        for _ in range(size):
+            key, offset = self._unpack(data, offset)
+            value, offset = self._unpack(data, offset)
+            result[key] = value
+        return result, offset
+
+
+class RawCodec(Codec):
+    """
+    Little-endian buffers: uint32 arrays count, then for every array uint8 dtype index in ``DTYPE_NAMES``,
+    uint32 elements count and elements of that dtype.
+    Only payloads made of arrays can be represented, so ``{"array": ...}`` and ``{"arrays": [...]}``
+    """
+
+    media_types: tuple[str, ...] = ('application/octet-stream',)
+
+    DTYPE_NAMES: tuple[str, ...] = tuple(DTYPES)
+
+    def encode(self, payload: Any) -> bytes:
+        if not isinstance(payload, dict) or not ({'array', 'arrays'} & payload.keys()):
+            raise NotAcceptable('Only arrays can be encoded as raw buffers')
+
+        if 'arrays' in payload:
+            arrays: list = [item['array'] if isinstance(item, dict) else item for item in payload['arrays']]
+        else:
+            arrays: list = [payload['array']]
+
+        chunks: list[bytes | memoryview] = [struct.pack('<I', len(arrays))]
+        for array in arrays:
+            typed_array: TypedArray = array if isinstance(array, TypedArray) else TypedArray(array)
+            chunks.append(struct.pack('<BI', self.DTYPE_NAMES.index(typed_array.dtype), len(typed_array)))
+            chunks.append(typed_array.little_endian_view())
+        return b''.join(chunks)
+
+    def decode(self, body: bytes) -> dict:
+        try:
+            count: int = struct.unpack_from('<I', body)[0]
+            offset: int = 4
+            arrays: list[list[int | float]] = []
+            for _ in range(count):
+                dtype_index, size = struct.unpack_from('<BI', body, offset)
+                offset += 5
+                if dtype_index >= len(self.DTYPE_NAMES):
+                    raise ValueError(f'Invalid raw buffer: unknown dtype {dtype_index}')
+
+                dtype: str = self.DTYPE_NAMES[dtype_index]
+                nbytes: int = size * struct.calcsize(DTYPES[dtype])
+                if offset + nbytes > len(body):
+                    raise ValueError('Invalid raw buffer: unexpected end of data')
+
+                arrays.append(list(TypedArray.from_little_endian(body[offset:offset + nbytes], dtype)))
+                offset += nbytes
+        except struct.error as error:
+            raise ValueError(f'Invalid raw buffer: {error}') from error
+
+        if offset != len(body):
+            raise ValueError('Invalid raw buffer: trailing data')
+
+        if len(arrays) == 1:
+            return {'array': arrays[0], 'arrays': arrays}
+        return {'arrays': arrays}
+
+
+CODECS: tuple[Codec, ...] = (JsonCodec(), MsgpackCodec(), RawCodec())
+
+
+def parse_header(header: str) -> list[tuple[str, float]]:
+    """Splits ``Accept``-like header into values ordered by their quality, preserving order of equal ones"""
+    values: list[tuple[str, float]] = []
+    for part in header.split(','):
+        value, *params = [item.strip() for item in part.split(';')]
+        if not value:
+            continue
+
+        quality: float = 1.0
+        for param in params:
+            name, _, number = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(number)
+                except ValueError:
+                    quality = 0.0
+
+        values.append((value.lower(), quality))
+
+    return sorted(values, key=lambda item: item[1], reverse=True)
+
+
+def get_codec(content_type: str | None) -> Codec:
+    media_type: str = (content_type or 'application/json').split(';')[0].strip().lower()
+    for codec in CODECS:
+        if media_type in codec.media_types:
+            return codec
+
+    raise UnsupportedMediaType(f'Unsupported content type {media_type}')
+
+
+def negotiate_codec(accept: str | None, codecs: tuple[Codec, ...] = CODECS) -> Codec:
+    for media_type, quality in parse_header(accept or '*/*'):
+        if quality <= 0:
+            continue
+        if media_type in ('*/*', 'application/*'):
+            return codecs[0]
+        for codec in codecs:
+            if media_type in codec.media_types:
+                return codec
+
+    raise NotAcceptable(f'None of {accept} can be produced')
+
+
+def available_encodings() -> tuple[str, ...]:
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    encodings: tuple[str, ...] = available_encodings()
+    for encoding, quality in parse_header(accept_encoding or ''):
+        if quality <= 0:
+            continue
+        if encoding == '*':
+            return encodings[0]
+        if encoding in encodings:
+            return encoding
+
+    return None
+
+
+def compress(body: bytes, encoding: str | None) -> tuple[bytes, str | None]:
+    if encoding is None or len(body) < COMPRESSION_MIN_SIZE:
+        return body, None
+
+    if encoding == 'br':
+        return brotli.compress(body), encoding
+    return gzip.compress(body, compresslevel=6), encoding
+
+
+def decompress(body: bytes, encoding: str | None, max_size: int | None = None) -> bytes:
+    """Inflates request body, stopping as soon as it grows over ``max_size`` bytes"""
+    encoding = (encoding or 'identity').strip().lower()
+    limit: int = 0 if max_size is None else max_size + 1
+
+    if encoding == 'identity':
+        result: bytes = body
+    elif encoding == 'gzip':
+        decompressor = zlib.decompressobj(wbits=31)
+        try:
+            result: bytes = decompressor.decompress(body, limit)
+        except zlib.error as error:
+            raise ValueError(f'Invalid gzip body: {error}') from error
+        if not decompressor.eof and not (limit and len(result) == limit):
+            raise ValueError('Invalid gzip body: unexpected end of data')
+    elif encoding == 'br' and brotli is not None:
+        try:
+            if limit:
+                result: bytes = brotli.Decompressor().process(body, output_buffer_limit=limit)
+            else:
+                result: bytes = brotli.decompress(body)
+        except TypeError:
+            raise UnsupportedMediaType('Limited brotli decompression needs brotli 1.1 or newer')
+        except brotli.error as error:
+            raise ValueError(f'Invalid brotli body: {error}') from error
+    else:
+        raise UnsupportedMediaType(f'Unsupported content encoding {encoding}')
+
+    if max_size is not None and len(result) > max_size:
+        raise BodyTooLarge(f'Decompressed request body is larger than {max_size} bytes')
+    return result
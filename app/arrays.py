@@ -1,11 +1,20 @@
 from numbers import Number
 from typing import Generator, Callable, Any, Iterable, NoReturn
 
+from .arrays_validation import parse_number
+from .typed_arrays import TypedArray
+
 
 class ArraysManagerAbstract:
     def create(self) -> list:
         raise NotImplementedError
 
+    def get(self, array_id: int) -> list:
+        raise NotImplementedError
+
+    def update(self, array_id: int, lst: list) -> list:
+        raise NotImplementedError
+
     def delete(self, array_id: int) -> None:
         raise NotImplementedError
 
@@ -23,6 +32,13 @@ class ArraysManager(ArraysManagerAbstract):
         self._objects.append(lst)
         return lst
 
+    def get(self, array_id: int) -> list:
+        return self._objects[array_id]
+
+    def update(self, array_id: int, lst: list) -> list:
+        self._objects[array_id] = lst
+        return lst
+
     def delete(self, array_id: int) -> None:
         del self._objects[array_id]
 
@@ -50,14 +66,39 @@ class ArraysManager(ArraysManagerAbstract):
             if array[-1] > len(array):
                 yield array
 
+    @staticmethod
+    def get_array_sum(array: list[Number]) -> Number:
+        return sum(array)
+
     def get_arrays_with_max_elems_sum(self) -> Generator:
-        arrays_with_sums: dict = dict(zip(map(sum, self.objects), self.objects))
+        arrays_with_sums: dict = dict(zip(map(self.get_array_sum, self.objects), self.objects))
         max_sum_arrays: filter = filter(lambda item: item[0] == max(arrays_with_sums.keys()),
                                         arrays_with_sums.items())
         for array_sum, array in max_sum_arrays:
             yield array
 
 
+class TypedArraysManager(ArraysManager):
+    """Stores every array as ``TypedArray`` of the narrowest fitting dtype"""
+
+    def __init__(self):
+        super().__init__()
+        self._objects: list[TypedArray] = list()
+
+    def create(self, lst: list = None) -> TypedArray:
+        # Empty TypedArray is falsy, so the base class would replace it with a list
+        array: TypedArray = TypedArray(lst if lst is not None else ())
+        self._objects.append(array)
+        return array
+
+    def update(self, array_id: int, lst: list) -> TypedArray:
+        return super().update(array_id, TypedArray(lst))
+
+    @staticmethod
+    def get_array_sum(array: TypedArray) -> Number:
+        return array.sum()
+
+
 class MenuAbstract:
     def serve(self) -> None:
         raise NotImplementedError
@@ -150,7 +191,7 @@ class AddArray(Option, metaclass=OptionMetaclass):
         while inp.strip().lower() != 'стоп':
             inp = inp.strip().split()
             for i in inp:
-                array.append(int(i))
+                array.append(parse_number(i))
             inp = input()
 
         return array
@@ -193,7 +234,7 @@ class ConsoleOutput(OptionsOutput):
 
 
 def main():
-    menu = Menu(OptionMetaclass.options, ArraysManager(), RendererToStrs(), ConsoleOutput())
+    menu = Menu(OptionMetaclass.options, TypedArraysManager(), RendererToStrs(), ConsoleOutput())
     menu.serve_forever()
 
 
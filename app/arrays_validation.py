@@ -1,8 +1,32 @@
+import math
 import re
 
 
-def clear_array(array: str) -> list[int | float]:
-    return re.findall(r'-?\d+\.\d+|\d+', array)
+NUMBER_PATTERN: re.Pattern = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+class TooManyElements(ValueError):
+    pass
+
+
+def parse_number(number: str) -> int | float:
+    number = number.strip()
+    if '.' in number or 'e' in number.lower():
+        result: float = float(number)
+        if not math.isfinite(result):
+            raise ValueError(f'{number} is out of range')
+        return result
+    return int(number)
+
+
+def clear_array(array: str, max_elements: int | None = None) -> list[int | float]:
+    result: list[int | float] = []
+    for match in NUMBER_PATTERN.finditer(array):
+        if max_elements is not None and len(result) >= max_elements:
+            raise TooManyElements(f'Array can not contain more than {max_elements} elements')
+        result.append(parse_number(match.group()))
+
+    return result
 
 
 def main():
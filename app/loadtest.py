@@ -0,0 +1,406 @@
+import argparse
+import http.client
+import importlib.util
+import math
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from socketserver import ThreadingMixIn
+from typing import Callable
+from urllib.parse import urlencode
+from wsgiref.simple_server import WSGIServer, WSGIRequestHandler, make_server
+
+
+BASE_DIR: Path = Path(__file__).resolve().parent.parent
+
+ENDPOINTS: tuple[str, ...] = ('main', 'add-array', 'save-changes', 'delete-array', 'process-arrays')
+
+DEFAULT_MIX: str = 'main=4,add-array=3,save-changes=1,delete-array=1,process-arrays=1'
+
+SERVER_MODES: tuple[str, ...] = ('threaded', 'processes', 'asgi')
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parses traffic mix like ``main=4,add-array=1`` into endpoint weights"""
+    weights: dict[str, float] = dict()
+    for part in mix.split(','):
+        name, _, weight = part.strip().partition('=')
+        if name not in ENDPOINTS:
+            raise ValueError(f'Unknown endpoint {name}, choose from {", ".join(ENDPOINTS)}')
+        weights[name] = float(weight or 1)
+
+    if not any(weight > 0 for weight in weights.values()):
+        raise ValueError('Traffic mix must have at least one positive weight')
+    return weights
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return math.nan
+
+    rank: int = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class RunResult:
+    mode: str
+    backend: str
+    duration: float
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    statuses: Counter = field(default_factory=Counter)
+    endpoint_errors: Counter = field(default_factory=Counter)
+    failures: int = 0
+
+    def add(self, endpoint: str, status: int | None, latency: float) -> None:
+        if status is None or status >= 400:
+            self.endpoint_errors[endpoint] += 1
+        if status is None:
+            self.failures += 1
+            return
+
+        self.latencies.setdefault(endpoint, []).append(latency)
+        self.statuses[status] += 1
+
+    def merge(self, other: 'RunResult') -> None:
+        for endpoint, latencies in other.latencies.items():
+            self.latencies.setdefault(endpoint, []).extend(latencies)
+        self.statuses.update(other.statuses)
+        self.endpoint_errors.update(other.endpoint_errors)
+        self.failures += other.failures
+
+    @property
+    def requests(self) -> int:
+        return sum(len(latencies) for latencies in self.latencies.values())
+
+    @property
+    def errors(self) -> int:
+        return self.failures + sum(count for status, count in self.statuses.items() if status >= 400)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.duration if self.duration else 0.0
+
+    def summary(self, endpoint: str | None = None) -> dict[str, float]:
+        """Latency percentiles in milliseconds and errors of the endpoint or of all requests"""
+        if endpoint is None:
+            latencies: list[float] = sorted(latency for values in self.latencies.values() for latency in values)
+        else:
+            latencies: list[float] = sorted(self.latencies.get(endpoint, ()))
+
+        return {
+            'requests': len(latencies),
+            'p50': percentile(latencies, 50) * 1000,
+            'p95': percentile(latencies, 95) * 1000,
+            'p99': percentile(latencies, 99) * 1000,
+            'errors': self.errors if endpoint is None else self.endpoint_errors[endpoint],
+        }
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class QueuedWSGIServer(WSGIServer):
+    # Default listen backlog of 5 overflows under load and clients wait for SYN retransmits
+    request_queue_size: int = 1024
+
+
+class ThreadingWSGIServer(ThreadingMixIn, QueuedWSGIServer):
+    daemon_threads: bool = True
+
+
+def serve_threaded(host: str, port: int, workers: int) -> None:
+    from project.wsgi import application
+
+    make_server(host, port, application, ThreadingWSGIServer, QuietRequestHandler).serve_forever()
+
+
+def serve_processes(host: str, port: int, workers: int) -> None:
+    """Pre-forks single-threaded WSGI workers accepting from one socket, every worker has its own arrays"""
+    from project.wsgi import application
+
+    server: WSGIServer = make_server(host, port, application, QueuedWSGIServer, QuietRequestHandler)
+    children: list[int] = []
+    for _ in range(workers):
+        pid: int = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            server.serve_forever()
+            os._exit(0)
+        children.append(pid)
+
+    def stop(signum, frame) -> None:
+        for child in children:
+            os.kill(child, signal.SIGTERM)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    for child in children:
+        os.waitpid(child, 0)
+
+
+SERVERS: dict[str, Callable[[str, int, int], None]] = {
+    'threaded': serve_threaded,
+    'processes': serve_processes,
+}
+
+
+def get_free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def get_server_command(mode: str, host: str, port: int, workers: int) -> list[str]:
+    if mode == 'asgi':
+        if importlib.util.find_spec('uvicorn') is None:
+            raise RuntimeError('ASGI mode needs uvicorn, install it with "pip install uvicorn"')
+        return [sys.executable, '-m', 'uvicorn', 'project.asgi:application', '--host', host, '--port', str(port),
+                '--workers', str(workers), '--no-access-log', '--log-level', 'warning']
+
+    if mode == 'processes' and not hasattr(os, 'fork'):
+        raise RuntimeError('Processes mode needs os.fork')
+
+    return [sys.executable, '-m', 'app.loadtest', 'serve', mode, host, str(port), str(workers)]
+
+
+class Server:
+    """Runs the app in a subprocess, so the load generator does not compete with it for the GIL"""
+
+    def __init__(self, mode: str, backend: str, settings_module: str, host: str = '127.0.0.1', workers: int = 4):
+        self.mode: str = mode
+        self.host: str = host
+        self.port: int = get_free_port(host)
+        self.command: list[str] = get_server_command(mode, host, self.port, workers)
+        self.env: dict = dict(
+            os.environ,
+            DJANGO_SETTINGS_MODULE=settings_module,
+            ARRAYS_MANAGER_BACKEND=backend,
+            # Every load test client comes from the same address, so the rate limits would reject most requests
+            ARRAYS_RATE_LIMIT='1e9',
+            ARRAYS_RATE_BURST='1e9',
+        )
+        self.env.setdefault('DjangoSecretKeyLaba1', 'load-test')
+        self._process: subprocess.Popen | None = None
+        self._log = None
+
+    def __enter__(self) -> 'Server':
+        self._log = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(self.command, cwd=BASE_DIR, env=self.env,
+                                         stdout=subprocess.DEVNULL, stderr=self._log)
+        try:
+            self.wait_ready()
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._log.close()
+
+    def wait_ready(self, timeout: float = 30) -> None:
+        deadline: float = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                self._log.seek(0)
+                raise RuntimeError(f'Server exited with {self._process.returncode}:\n{self._log.read().decode()}')
+            try:
+                connection = http.client.HTTPConnection(self.host, self.port, timeout=1)
+                connection.request('GET', '/')
+                if connection.getresponse().status == 200:
+                    return
+            except OSError:
+                time.sleep(0.1)
+
+        raise RuntimeError(f'Server did not start in {timeout} seconds')
+
+
+class Client:
+    """
+    Keeps CSRF token and the number of arrays like a browser tab, requests are sent by the endpoint names.
+    wsgiref servers close the connection after every response, so it is reopened for the next request.
+    The number of arrays is read from the main page, while other clients change it and every worker process
+    has its own arrays, so ids of deleted and saved arrays can still be stale and such errors are counted per endpoint
+    """
+
+    def __init__(self, host: str, port: int, random_: random.Random, elements: int = 10, timeout: float = 30):
+        self.host: str = host
+        self.port: int = port
+        self.random: random.Random = random_
+        self.elements: int = elements
+        self.timeout: float = timeout
+        self.connection: http.client.HTTPConnection = http.client.HTTPConnection(host, port, timeout=timeout)
+        self.csrf_token: str = ''
+        self.arrays: int = 0
+
+    def make_array_str(self) -> str:
+        return ', '.join(str(self.random.randint(-100, 100)) for _ in range(self.elements))
+
+    def get_request(self, endpoint: str) -> tuple[str, str, bytes | None]:
+        if endpoint == 'main':
+            return 'GET', '/', None
+        if endpoint == 'add-array':
+            return 'POST', '/add-array', urlencode({'new-array': self.make_array_str()}).encode()
+        if endpoint == 'save-changes':
+            return 'POST', '/save-changes', urlencode({'array': [self.make_array_str() for _ in range(self.arrays)]},
+                                                      doseq=True).encode()
+        if endpoint == 'delete-array':
+            return 'GET', f'/delete-array/{self.random.randrange(self.arrays)}', None
+        return 'GET', '/process-arrays', None
+
+    def send(self, method: str, path: str, body: bytes | None = None) -> tuple[http.client.HTTPResponse, bytes]:
+        """Only GET is resent after the server closes the connection, other methods may have already been applied"""
+        headers: dict[str, str] = {
+            'Referer': f'http://{self.host}:{self.port}/',
+            'Cookie': f'csrftoken={self.csrf_token}',
+            'X-CSRFToken': self.csrf_token,
+        }
+        if body is not None:
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+
+        try:
+            self.connection.request(method, path, body, headers)
+            response: http.client.HTTPResponse = self.connection.getresponse()
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            self.connection.close()
+            if method != 'GET':
+                raise
+            self.connection.request(method, path, body, headers)
+            response: http.client.HTTPResponse = self.connection.getresponse()
+
+        return response, response.read()
+
+    def update_arrays(self, endpoint: str, status: int, body: bytes) -> None:
+        if endpoint == 'main' and status == 200:
+            self.arrays = body.count(b'name="array"')
+        elif endpoint == 'add-array' and status == 302:
+            self.arrays += 1
+        elif endpoint == 'delete-array' and status == 302:
+            self.arrays = max(0, self.arrays - 1)
+
+    def login(self) -> None:
+        """Gets CSRF cookie from the main page, it is required by every POST"""
+        response, body = self.send('GET', '/')
+        for header, value in response.getheaders():
+            if header.lower() == 'set-cookie' and value.startswith('csrftoken='):
+                self.csrf_token = value.split(';')[0].partition('=')[2]
+        self.update_arrays('main', response.status, body)
+
+    def request(self, endpoint: str) -> tuple[str, int | None]:
+        """Returns the endpoint actually requested, there is nothing to delete until an array is added"""
+        if endpoint == 'delete-array' and not self.arrays:
+            endpoint = 'add-array'
+
+        try:
+            response, body = self.send(*self.get_request(endpoint))
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            return endpoint, None
+
+        self.update_arrays(endpoint, response.status, body)
+        return endpoint, response.status
+
+
+def run_clients(host: str, port: int, mix: dict[str, float], clients: int, duration: float, elements: int = 10,
+                seed: int = 0) -> RunResult:
+    """Measured window starts when every client has logged in and lasts until the last request is answered"""
+    endpoints: list[str] = list(mix)
+    weights: list[float] = list(mix.values())
+    results: list[RunResult] = [RunResult('', '', duration) for _ in range(clients)]
+    window: list[float] = [0.0, 0.0]
+
+    def begin() -> None:
+        window[0] = time.perf_counter()
+        window[1] = window[0] + duration
+
+    start: threading.Barrier = threading.Barrier(clients, action=begin)
+
+    def work(result: RunResult, client: Client) -> None:
+        try:
+            client.login()
+        except (OSError, http.client.HTTPException):
+            client.connection.close()
+        start.wait()
+        while time.perf_counter() < window[1]:
+            began: float = time.perf_counter()
+            endpoint, status = client.request(client.random.choices(endpoints, weights)[0])
+            result.add(endpoint, status, time.perf_counter() - began)
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=work, args=(result, Client(host, port, random.Random(seed + i), elements)))
+        for i, result in enumerate(results)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    total: RunResult = RunResult('', '', time.perf_counter() - window[0])
+    for result in results:
+        total.merge(result)
+    return total
+
+
+def run(mode: str, backend: str, mix: dict[str, float], clients: int = 50, duration: float = 10,
+        settings_module: str = 'project.settings', workers: int = 4, elements: int = 10, seed: int = 0) -> RunResult:
+    with Server(mode, backend, settings_module, workers=workers) as server:
+        result: RunResult = run_clients(server.host, server.port, mix, clients, duration, elements, seed)
+
+    result.mode = mode
+    result.backend = backend
+    return result
+
+
+def format_results(results: list[RunResult]) -> list[str]:
+    lines: list[str] = [
+        f'{"mode":<10}{"backend":<40}{"endpoint":<16}{"requests":>9}{"req/s":>9}{"p50 ms":>9}{"p95 ms":>9}'
+        f'{"p99 ms":>9}{"errors":>8}'
+    ]
+    for result in results:
+        for endpoint in (None, *ENDPOINTS):
+            summary: dict[str, float] = result.summary(endpoint)
+            if endpoint is not None and not summary['requests'] and not summary['errors']:
+                continue
+
+            lines.append(
+                f'{result.mode:<10}{result.backend:<40}{endpoint or "all":<16}{summary["requests"]:>9}'
+                f'{summary["requests"] / result.duration:>9.1f}{summary["p50"]:>9.1f}{summary["p95"]:>9.1f}'
+                f'{summary["p99"]:>9.1f}{summary["errors"]:>8}'
+            )
+
+    return lines
+
+
+def main():
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Runs the app for load tests')
+    parser.add_argument('command', choices=['serve'])
+    parser.add_argument('mode', choices=SERVERS)
+    parser.add_argument('host')
+    parser.add_argument('port', type=int)
+    parser.add_argument('workers', type=int)
+    args: argparse.Namespace = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings')
+    SERVERS[args.mode](args.host, args.port, args.workers)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.loadtest import DEFAULT_MIX, SERVER_MODES, RunResult, format_results, parse_mix, run
+
+
+class Command(BaseCommand):
+    help = 'Starts the app on localhost in every server mode and backend and drives it with concurrent clients'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modes', default='threaded,processes',
+                            help=f'Comma separated server modes from {", ".join(SERVER_MODES)}')
+        parser.add_argument('--backends', default='app.arrays.ArraysManager,app.arrays.TypedArraysManager',
+                            help='Comma separated ARRAYS_MANAGER_BACKEND values')
+        parser.add_argument('--mix', default=DEFAULT_MIX, help='Endpoint weights, e.g. main=4,add-array=1')
+        parser.add_argument('--clients', type=int, default=50)
+        parser.add_argument('--duration', type=float, default=10, help='Seconds of every run')
+        parser.add_argument('--workers', type=int, default=4, help='Server processes in processes and asgi modes')
+        parser.add_argument('--elements', type=int, default=10, help='Elements in every sent array')
+        parser.add_argument('--app-settings', default='project.settings', help='Settings module of the server')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='Writes results as JSON to compare them with later runs')
+
+    def handle(self, *args, **options):
+        try:
+            mix: dict[str, float] = parse_mix(options['mix'])
+        except ValueError as error:
+            raise CommandError(error)
+
+        modes: list[str] = options['modes'].split(',')
+        for mode in modes:
+            if mode not in SERVER_MODES:
+                raise CommandError(f'Unknown server mode {mode}, choose from {", ".join(SERVER_MODES)}')
+
+        results: list[RunResult] = []
+        for mode in modes:
+            for backend in options['backends'].split(','):
+                self.stderr.write(f'Running {mode} server with {backend} for {options["duration"]} s')
+                try:
+                    results.append(run(mode, backend, mix, options['clients'], options['duration'],
+                                       options['app_settings'], options['workers'], options['elements'],
+                                       options['seed']))
+                except RuntimeError as error:
+                    self.stderr.write(self.style.ERROR(str(error)))
+
+        self.stdout.write('\n'.join(format_results(results)))
+        if 'processes' in modes or 'asgi' in modes:
+            self.stdout.write(
+                '\nEvery worker process keeps its own arrays, so their counts differ from the threaded run'
+            )
+
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump([
+                    {
+                        'mode': result.mode,
+                        'backend': result.backend,
+                        'duration': result.duration,
+                        'throughput': result.throughput,
+                        'errors': result.errors,
+                        'statuses': {str(status): count for status, count in result.statuses.items()},
+                        'endpoints': {endpoint or 'all': result.summary(endpoint) for endpoint in (None, *mix)},
+                    }
+                    for result in results
+                ], file, indent=4)
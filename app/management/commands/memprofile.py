@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app import arrays
+from app.memprofile import MemoryProfiler, replay_workload
+
+
+BACKENDS: dict[str, type[arrays.ArraysManager]] = {
+    'list': arrays.ArraysManager,
+    'typed': arrays.TypedArraysManager,
+}
+
+
+class Command(BaseCommand):
+    help = 'Replays synthetic arrays workload under tracemalloc and prints allocations per operation'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--backend', choices=BACKENDS, default='typed')
+        parser.add_argument('--arrays', type=int, default=1000, help='Arrays created every round')
+        parser.add_argument('--elements', type=int, default=10, help='Elements in every array')
+        parser.add_argument('--rounds', type=int, default=3)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--frames', type=int, default=1, help='Traceback frames stored per allocation')
+        parser.add_argument('--top', type=int, default=10, help='How many allocation sites to show')
+        parser.add_argument('--max-peak-kib', type=float, help='Fail if peak of any operation call exceeds it')
+        parser.add_argument('--max-retained-kib', type=float,
+                            help='Fail if any operation retains more per call on average')
+
+    def handle(self, *args, **options):
+        profiler: MemoryProfiler = MemoryProfiler(frames=options['frames'])
+        manager: arrays.ArraysManager = BACKENDS[options['backend']]()
+
+        profiler.start()
+        try:
+            replay_workload(manager, profiler, options['arrays'], options['elements'], options['rounds'],
+                            options['seed'], keep_last=True)
+            top_sites: list = profiler.top_sites(options['top'])
+        finally:
+            profiler.stop()
+
+        self.stdout.write(f'{"operation":<32}{"calls":>8}{"peak KiB":>12}{"retained KiB":>14}{"KiB per call":>14}')
+        for label, stats in profiler.report().items():
+            self.stdout.write(
+                f'{label:<32}{stats["calls"]:>8}{stats["peak"] / 1024:>12.1f}{stats["retained"] / 1024:>14.1f}'
+                f'{stats["retained_per_call"] / 1024:>14.1f}'
+            )
+
+        self.stdout.write(f'\nTop {len(top_sites)} allocation sites:')
+        for statistic in top_sites:
+            frame = statistic.traceback[0]
+            self.stdout.write(f'{statistic.size / 1024:>10.1f} KiB {statistic.count:>8} blocks  '
+                              f'{frame.filename}:{frame.lineno}')
+
+        violations: list[str] = profiler.check(
+            max_peak=None if options['max_peak_kib'] is None else int(options['max_peak_kib'] * 1024),
+            max_retained=None if options['max_retained_kib'] is None else int(options['max_retained_kib'] * 1024),
+        )
+        if violations:
+            raise CommandError('Memory thresholds exceeded:\n' + '\n'.join(violations))
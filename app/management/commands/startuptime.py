@@ -0,0 +1,30 @@
+from statistics import median
+
+from django.core.management.base import BaseCommand
+
+from app.startup import measure_startup, StartupReport
+
+
+class Command(BaseCommand):
+    help = 'Measures worker cold start time of the settings profiles with "python -X importtime"'
+
+    def add_arguments(self, parser):
+        parser.add_argument('settings_modules', nargs='*', default=['project.settings', 'project.settings_lean'])
+        parser.add_argument('--target', default='project.wsgi', help='Module to import, e.g. project.asgi')
+        parser.add_argument('--import-only', action='store_true',
+                            help='Measure only the target import, without loading URLconf and template tags')
+        parser.add_argument('--runs', type=int, default=5)
+        parser.add_argument('--top', type=int, default=10, help='How many of the slowest imports to show')
+
+    def handle(self, *args, **options):
+        for settings_module in options['settings_modules']:
+            reports: list[StartupReport] = [
+                measure_startup(settings_module, options['target'], options['import_only'])
+                for _ in range(options['runs'])
+            ]
+            report: StartupReport = reports[-1]
+            total_ms: float = median(report.total_us for report in reports) / 1000
+
+            self.stdout.write(f'{settings_module}: {total_ms:.1f} ms median, {report.modules_count} modules')
+            for record in report.slowest(options['top']):
+                self.stdout.write(f'    {record.cumulative_us / 1000:8.1f} ms  {record.module}')
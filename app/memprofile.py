@@ -0,0 +1,150 @@
+import random
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Callable, Iterator
+
+from . import arrays
+from .arrays_validation import clear_array
+
+
+@dataclass
+class OperationStats:
+    calls: int = 0
+    peak: int = 0
+    retained: int = 0
+
+    @property
+    def retained_per_call(self) -> float:
+        return self.retained / self.calls if self.calls else 0.0
+
+
+class MemoryProfiler:
+    """
+    Collects peak and retained allocations of labeled operations with tracemalloc.
+    Peak is measured with process-wide tracemalloc.reset_peak(), so tracked operations must not be nested
+    and concurrent ones share their peaks
+    """
+
+    IGNORED_FILES: tuple[str, ...] = (tracemalloc.__file__, '<frozen importlib._bootstrap>',
+                                      '<frozen importlib._bootstrap_external>', '<unknown>')
+
+    def __init__(self, frames: int = 1):
+        self.frames: int = frames
+        self.stats: dict[str, OperationStats] = dict()
+        self._lock: threading.Lock = threading.Lock()
+        self._started: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+
+    def stop(self) -> None:
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats.clear()
+
+    @contextmanager
+    def track(self, label: str | Callable[[], str]) -> Iterator[None]:
+        """Does nothing unless tracemalloc is tracing, label can be computed after the operation"""
+        if not tracemalloc.is_tracing():
+            yield
+            return
+
+        before: int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self.record(label() if callable(label) else label, max(0, peak - before), current - before)
+
+    def record(self, label: str, peak: int, retained: int) -> None:
+        with self._lock:
+            stats: OperationStats = self.stats.setdefault(label, OperationStats())
+            stats.calls += 1
+            stats.peak = max(stats.peak, peak)
+            stats.retained += retained
+
+    def report(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                label: {**asdict(stats), 'retained_per_call': stats.retained_per_call}
+                for label, stats in sorted(self.stats.items())
+            }
+
+    def top_sites(self, count: int = 10, key_type: str = 'lineno') -> list[tracemalloc.Statistic]:
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, filename) for filename in self.IGNORED_FILES]
+        )
+        return snapshot.statistics(key_type)[:count]
+
+    def check(self, max_peak: int | None = None, max_retained: int | None = None) -> list[str]:
+        """
+        Returns descriptions of operations exceeding the thresholds given in bytes.
+        Peak is the largest one of single call and retained is averaged per call, so neither grows with call count
+        """
+        violations: list[str] = []
+        with self._lock:
+            for label, stats in sorted(self.stats.items()):
+                if max_peak is not None and stats.peak > max_peak:
+                    violations.append(f'{label}: peak {stats.peak} B > {max_peak} B')
+                if max_retained is not None and stats.retained_per_call > max_retained:
+                    violations.append(f'{label}: retained {stats.retained_per_call:.0f} B per call > {max_retained} B')
+
+        return violations
+
+
+PROFILER: MemoryProfiler = MemoryProfiler()
+
+
+def make_array_str(random_: random.Random, elements: int) -> str:
+    return ', '.join(str(random_.randint(-100, 100)) for _ in range(elements))
+
+
+def replay_workload(manager: arrays.ArraysManagerAbstract, profiler: MemoryProfiler, arrays_count: int = 1000,
+                    elements: int = 10, rounds: int = 3, seed: int = 0, keep_last: bool = False) -> None:
+    """
+    Runs the same operations as the views do on ``manager``, every operation is tracked separately.
+    With ``keep_last`` arrays of the last round are not deleted, so allocation sites show what the manager keeps
+    """
+    random_: random.Random = random.Random(seed)
+
+    for round_ in range(rounds):
+        array_strs: list[str] = [make_array_str(random_, elements) for _ in range(arrays_count)]
+
+        # Parsed arrays are dropped inside the block, so retained memory shows only what parsing leaks
+        with profiler.track('clear_array'):
+            parsed: list[list[int | float]] = [clear_array(array_str) for array_str in array_strs]
+            del parsed
+
+        with profiler.track('add_array'):
+            for array_str in array_strs:
+                manager.create(clear_array(array_str))
+
+        with profiler.track('update'):
+            for i in range(0, len(manager.objects), 2):
+                manager.update(i, clear_array(array_strs[i]))
+
+        with profiler.track('get_arrays_with_max_elems_sum'):
+            list(manager.get_arrays_with_max_elems_sum())
+
+        with profiler.track('process_arrays'):
+            arrays.ProcessArrays()(arrays_manager=manager)
+
+        if keep_last and round_ == rounds - 1:
+            break
+
+        with profiler.track('delete'):
+            while manager.objects:
+                manager.delete(len(manager.objects) - 1)
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest
+
+
+class MemoryProfilingMiddleware:
+    """
+    Tracks allocations of every view with tracemalloc when ARRAYS_MEMORY_PROFILING setting is on.
+    Profiler is imported only then, so workers without profiling do not load tracemalloc
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'ARRAYS_MEMORY_PROFILING', False):
+            raise MiddlewareNotUsed
+
+        from .memprofile import PROFILER
+
+        self.get_response = get_response
+        self.profiler = PROFILER
+        self.profiler.start()
+
+    @staticmethod
+    def get_label(request: HttpRequest) -> str:
+        resolver_match = getattr(request, 'resolver_match', None)
+        return f'view:{resolver_match.url_name if resolver_match else "unresolved"}'
+
+    def __call__(self, request: HttpRequest):
+        with self.profiler.track(lambda: self.get_label(request)):
+            return self.get_response(request)
@@ -0,0 +1,93 @@
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+
+BASE_DIR: Path = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupReport:
+    settings_module: str
+    target: str
+    records: list[ImportRecord]
+
+    @property
+    def total_us(self) -> int:
+        return sum(record.cumulative_us for record in self.records if record.depth == 0)
+
+    @property
+    def modules_count(self) -> int:
+        return len(self.records)
+
+    def slowest(self, count: int = 10) -> list[ImportRecord]:
+        return sorted(self.records, key=lambda record: record.cumulative_us, reverse=True)[:count]
+
+
+def parse_importtime(output: Iterable[str] | str) -> list[ImportRecord]:
+    if isinstance(output, str):
+        output = output.splitlines()
+
+    records: list[ImportRecord] = []
+    for line in output:
+        if not line.startswith('import time:'):
+            continue
+
+        fields: list[str] = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+
+        name: str = fields[2].rstrip()
+        module: str = name.lstrip()
+        depth: int = (len(name) - len(module) - 1) // 2
+        records.append(ImportRecord(module, int(fields[0]), int(fields[1]), depth))
+
+    return records
+
+
+# Django loads URLconf, views and template tag libraries on the first request, worker is ready after that
+READINESS_CODE: str = '''
+from django.template import engines
+from django.urls import get_resolver
+get_resolver().url_patterns
+engines.all()
+'''
+
+
+def measure_startup(settings_module: str, target: str = 'project.wsgi', import_only: bool = False) -> StartupReport:
+    env: dict = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    env.setdefault('DjangoSecretKeyLaba1', 'startup-time-measurement')
+
+    code: str = f'import {target}' if import_only else f'import {target}\n{READINESS_CODE}'
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f'Can not import {target} with {settings_module}:\n{completed.stderr}')
+
+    return StartupReport(settings_module, target, parse_importtime(completed.stderr))
+
+
+def main():
+    for settings_module in ('project.settings', 'project.settings_lean'):
+        report: StartupReport = measure_startup(settings_module)
+        print(f'{settings_module}: {report.total_us / 1000:.1f} ms, {report.modules_count} modules')
+
+
+if __name__ == '__main__':
+    main()
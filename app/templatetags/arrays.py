@@ -1,13 +1,13 @@
 from django import template
 
-from ..views import ARRAY_MANAGER
-
 
 register = template.Library()
 
 
 @register.inclusion_tag('app/arrays.html')
 def show_arrays(mutable: bool = False):
+    from ..views import ARRAY_MANAGER
+
     arrays = ARRAY_MANAGER.objects
 
     context: dict = {
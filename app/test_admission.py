@@ -0,0 +1,122 @@
+import threading
+import time
+import unittest
+
+from app import admission
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.bucket = admission.TokenBucket(rate=2, capacity=3, clock=self.clock)
+
+    def test_try_acquire(self):
+        self.assertTrue(all(self.bucket.try_acquire() for _ in range(3)))
+        self.assertFalse(self.bucket.try_acquire())
+        self.assertEqual(self.bucket.retry_after(), 0.5)
+
+        self.clock.now = 0.5
+        self.assertTrue(self.bucket.try_acquire())
+        self.assertFalse(self.bucket.try_acquire())
+
+    def test_rate(self):
+        for rate in (0, -1):
+            with self.assertRaises(ValueError):
+                admission.TokenBucket(rate=rate, capacity=3, clock=self.clock)
+
+    def test_capacity(self):
+        self.clock.now = 100
+
+        self.assertTrue(all(self.bucket.try_acquire() for _ in range(3)))
+        self.assertFalse(self.bucket.try_acquire())
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.limiter = admission.RateLimiter(rate=1, capacity=1, max_clients=2, clock=self.clock)
+
+    def test_per_client(self):
+        self.assertEqual(self.limiter.try_acquire('a'), (True, 0.0))
+        self.assertEqual(self.limiter.try_acquire('a'), (False, 1.0))
+        self.assertEqual(self.limiter.try_acquire('b'), (True, 0.0))
+
+    def test_max_clients(self):
+        for client in 'abc':
+            self.limiter.try_acquire(client)
+
+        self.assertEqual(list(self.limiter._buckets), ['b', 'c'])
+
+
+class TestCoalescer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.coalescer = admission.Coalescer()
+
+    def test_run(self):
+        self.assertEqual(self.coalescer.run('key', lambda: 1), (1, False))
+        self.assertEqual(self.coalescer.run('key', lambda: 2), (2, False))
+
+    def test_concurrent(self):
+        started: threading.Event = threading.Event()
+        release: threading.Event = threading.Event()
+        calls: list[int] = []
+
+        def function() -> int:
+            calls.append(1)
+            started.set()
+            release.wait()
+            return len(calls)
+
+        results: list[tuple] = []
+        leader = threading.Thread(target=lambda: results.append(self.coalescer.run('key', function)))
+        leader.start()
+        started.wait()
+
+        followers: list[threading.Thread] = [
+            threading.Thread(target=lambda: results.append(self.coalescer.run('key', function))) for _ in range(3)
+        ]
+        for follower in followers:
+            follower.start()
+        time.sleep(0.1)
+
+        release.set()
+        for thread in (leader, *followers):
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(results), [(1, False), (1, True), (1, True), (1, True)])
+
+    def test_error(self):
+        def function():
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            self.coalescer.run('key', function)
+
+        self.assertEqual(self.coalescer._calls, {})
+
+
+class TestCounters(unittest.TestCase):
+    def test_counters(self):
+        counters = admission.Counters()
+
+        counters.increment('a')
+        counters.increment('a', 2)
+
+        self.assertEqual(counters.snapshot(), {'a': 3})
+
+        counters.reset()
+
+        self.assertEqual(counters.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
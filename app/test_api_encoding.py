@@ -0,0 +1,170 @@
+import gzip
+import struct
+import unittest
+from unittest.mock import patch
+
+from app import api_encoding
+from app.typed_arrays import TypedArray
+
+
+class TestMsgpackCodec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.codec = api_encoding.MsgpackCodec()
+
+    def test_round_trip(self):
+        payloads: list = [
+            None, True, False, 0, 127, 128, 65536, 2 ** 40, -1, -33, -129, -2 ** 40, 1.5,
+            'строка', 'a' * 300, b'\x00\x01', [1, [2.5, -3]], list(range(20)),
+            {'arrays': [{'id': 0, 'array': [1, 2, 3]}]}, {str(i): i for i in range(20)},
+        ]
+
+        for payload in payloads:
+            self.assertEqual(self.codec.decode(self.codec.encode(payload)), payload)
+
+    def test_encode_spec(self):
+        self.assertEqual(self.codec.encode([1, -1, 'a']), b'\x93\x01\xff\xa1a')
+        self.assertEqual(self.codec.encode({'a': 1.0}), b'\x81\xa1a\xcb' + struct.pack('>d', 1.0))
+
+    def test_decode_invalid(self):
+        with self.assertRaises(ValueError):
+            self.codec.decode(b'\x93\x01')
+
+        with self.assertRaises(ValueError):
+            self.codec.decode(b'\x01\x02')
+
+        with self.assertRaises(ValueError):
+            self.codec.decode(b'\xc1')
+
+        with self.assertRaises(ValueError):
+            self.codec.decode(b'\x81\x90\x00')
+
+        with self.assertRaises(ValueError):
+            self.codec.decode(b'\x91' * 5000 + b'\x00')
+
+
+class TestJsonCodec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.codec = api_encoding.JsonCodec()
+
+    def test_decode(self):
+        self.assertEqual(self.codec.decode(b'{"array": [1, 2.5]}'), {'array': [1, 2.5]})
+        self.assertIsNone(self.codec.decode(b''))
+
+    def test_decode_invalid(self):
+        for body in (b'{', b'[NaN]', b'[Infinity]', b'[-Infinity]', b'[' * 100000 + b']' * 100000):
+            with self.assertRaises(ValueError):
+                self.codec.decode(body)
+
+
+class TestRawCodec(unittest.TestCase):
+    def setUp(self) -> None:
+        self.codec = api_encoding.RawCodec()
+
+    def test_round_trip(self):
+        body: bytes = self.codec.encode({'arrays': [{'id': 0, 'array': [1, 2.5]}, {'id': 1, 'array': []}]})
+
+        self.assertEqual(body, struct.pack('<IBI2dBI', 2, 4, 2, 1.0, 2.5, 0, 0))
+        self.assertEqual(self.codec.decode(body), {'arrays': [[1.0, 2.5], []]})
+
+    def test_dtypes(self):
+        arrays: list[list] = [[2 ** 53 + 1, 2], [-1, 1], [1e300, 2.0], [40000]]
+
+        body: bytes = self.codec.encode({'arrays': [TypedArray(array) for array in arrays]})
+        decoded: list[list] = self.codec.decode(body)['arrays']
+
+        self.assertEqual(decoded, arrays)
+        self.assertEqual([[type(elem) for elem in array] for array in decoded],
+                         [[type(elem) for elem in array] for array in arrays])
+        self.assertEqual(len(body), 4 + 4 * 5 + 2 * 8 + 2 * 1 + 2 * 8 + 1 * 4)
+
+    def test_single_array(self):
+        data: dict = self.codec.decode(self.codec.encode({'id': 0, 'array': [3, -1]}))
+
+        self.assertEqual(data['array'], [3, -1])
+
+    def test_not_arrays(self):
+        with self.assertRaises(api_encoding.NotAcceptable):
+            self.codec.encode({'results': []})
+
+    def test_decode_invalid(self):
+        with self.assertRaises(ValueError):
+            self.codec.decode(struct.pack('<IBI', 1, 0, 2))
+
+        with self.assertRaises(ValueError):
+            self.codec.decode(struct.pack('<IBI', 1, 0, 0) + b'\x00')
+
+        with self.assertRaises(ValueError):
+            self.codec.decode(struct.pack('<IBI', 1, 5, 0))
+
+
+class TestNegotiation(unittest.TestCase):
+    def test_parse_header(self):
+        self.assertEqual(api_encoding.parse_header('a;q=0.5, b, c;q=0.9'), [('b', 1.0), ('c', 0.9), ('a', 0.5)])
+
+    def test_negotiate_codec(self):
+        self.assertIsInstance(api_encoding.negotiate_codec(None), api_encoding.JsonCodec)
+        self.assertIsInstance(api_encoding.negotiate_codec('text/html, */*;q=0.1'), api_encoding.JsonCodec)
+        self.assertIsInstance(api_encoding.negotiate_codec('application/json;q=0.5, application/msgpack'),
+                              api_encoding.MsgpackCodec)
+        self.assertIsInstance(api_encoding.negotiate_codec('application/octet-stream'), api_encoding.RawCodec)
+
+        with self.assertRaises(api_encoding.NotAcceptable):
+            api_encoding.negotiate_codec('text/html')
+
+        with self.assertRaises(api_encoding.NotAcceptable):
+            api_encoding.negotiate_codec('application/octet-stream', (api_encoding.JsonCodec(),))
+
+    def test_get_codec(self):
+        self.assertIsInstance(api_encoding.get_codec(None), api_encoding.JsonCodec)
+        self.assertIsInstance(api_encoding.get_codec('application/x-msgpack'), api_encoding.MsgpackCodec)
+
+        with self.assertRaises(api_encoding.UnsupportedMediaType):
+            api_encoding.get_codec('text/plain')
+
+    @patch.object(api_encoding, 'brotli', None)
+    def test_negotiate_encoding(self):
+        self.assertEqual(api_encoding.negotiate_encoding('br, gzip;q=0.8'), 'gzip')
+        self.assertEqual(api_encoding.negotiate_encoding('*'), 'gzip')
+        self.assertIsNone(api_encoding.negotiate_encoding('gzip;q=0, identity'))
+        self.assertIsNone(api_encoding.negotiate_encoding(None))
+
+
+class TestCompression(unittest.TestCase):
+    def test_compress(self):
+        body: bytes = b'1' * api_encoding.COMPRESSION_MIN_SIZE
+
+        compressed, encoding = api_encoding.compress(body, 'gzip')
+
+        self.assertEqual(encoding, 'gzip')
+        self.assertEqual(api_encoding.decompress(compressed, 'gzip'), body)
+
+    def test_small_body(self):
+        self.assertEqual(api_encoding.compress(b'[]', 'gzip'), (b'[]', None))
+
+    def test_decompress(self):
+        self.assertEqual(api_encoding.decompress(gzip.compress(b'{}'), 'GZIP'), b'{}')
+        self.assertEqual(api_encoding.decompress(b'{}', None), b'{}')
+
+        with self.assertRaises(ValueError):
+            api_encoding.decompress(b'{}', 'gzip')
+
+        with self.assertRaises(api_encoding.UnsupportedMediaType):
+            api_encoding.decompress(b'{}', 'compress')
+
+        with self.assertRaises(ValueError):
+            api_encoding.decompress(gzip.compress(b'{}' * 100)[:-10], 'gzip')
+
+    def test_decompress_max_size(self):
+        body: bytes = gzip.compress(b'0' * 10 ** 7)
+
+        self.assertEqual(api_encoding.decompress(gzip.compress(b'1' * 100), 'gzip', max_size=100), b'1' * 100)
+
+        with self.assertRaises(api_encoding.BodyTooLarge):
+            api_encoding.decompress(body, 'gzip', max_size=1000)
+
+        with self.assertRaises(api_encoding.BodyTooLarge):
+            api_encoding.decompress(b'1' * 101, None, max_size=100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,29 @@ class TestArraysManager(unittest.TestCase):
             self.assertEqual(len(self.manager.objects), obj_count + 1)
             self.assertIs(self.manager.objects[-1], array)
 
+    def test_get(self):
+        with self.mock_objects([
+            [1],
+            [2],
+        ]):
+            self.assertEqual(self.manager.get(1), [2])
+
+            with self.assertRaises(IndexError):
+                self.manager.get(2)
+
+    def test_update(self):
+        with self.mock_objects([
+            [1],
+            [2],
+        ]):
+            array: list = [3, 4]
+
+            self.assertIs(self.manager.update(0, array), array)
+            self.assertEqual(self.manager.objects, [[3, 4], [2]])
+
+            with self.assertRaises(IndexError):
+                self.manager.update(2, [])
+
     def test_delete(self):
         with self.mock_objects([
             list(),
@@ -83,6 +106,36 @@ class TestArraysManager(unittest.TestCase):
             self.assertEqual(next(gen), [15, 5, 8])
 
 
+class TestTypedArraysManager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = arrays.TypedArraysManager()
+
+    def test_create(self):
+        array: arrays.TypedArray = self.manager.create([1, 300])
+
+        self.assertIsInstance(array, arrays.TypedArray)
+        self.assertEqual(array.dtype, 'int16')
+        self.assertIs(self.manager.objects[-1], array)
+
+        for args in ((), ([],)):
+            array = self.manager.create(*args)
+
+            self.assertIsInstance(array, arrays.TypedArray)
+            self.assertEqual(array, [])
+            self.assertIs(self.manager.objects[-1], array)
+
+    def test_update(self):
+        self.manager.create([1])
+
+        self.assertEqual(self.manager.update(0, [1.5]).dtype, 'float64')
+
+    def test_get_arrays_with_max_elems_sum(self):
+        self.manager.create([1, 3, 10])
+        self.manager.create([15, 5, 8])
+
+        self.assertEqual(next(self.manager.get_arrays_with_max_elems_sum()), [15, 5, 8])
+
+
 class TestMenu(unittest.TestCase):
     def setUp(self) -> None:
         self.menu = arrays.Menu(
@@ -195,6 +248,12 @@ class TestAddArray(unittest.TestCase):
         self.option(self.manager)
         self.manager.create.assert_called_once_with()
 
+    @patch('builtins.input', side_effect=['1 -2', '2.5', 'стоп'])
+    def test_add_numbers(self, input_mock: MagicMock):
+        self.manager.create.return_value = []
+
+        self.assertEqual(self.option(self.manager), [1, -2, 2.5])
+
 
 class TestProcessArrays(unittest.TestCase):
     def setUp(self) -> None:
@@ -0,0 +1,35 @@
+import unittest
+
+from app import arrays_validation
+
+
+class TestClearArray(unittest.TestCase):
+    def test_clear_array(self):
+        self.assertEqual(arrays_validation.clear_array('1, -2; 3.5 abc 4'), [1, -2, 3.5, 4])
+        self.assertEqual(arrays_validation.clear_array(''), [])
+
+    def test_max_elements(self):
+        self.assertEqual(arrays_validation.clear_array('1 2 3', max_elements=3), [1, 2, 3])
+
+        with self.assertRaises(arrays_validation.TooManyElements):
+            arrays_validation.clear_array('1 2 3', max_elements=2)
+
+    def test_types(self):
+        self.assertEqual([type(elem) for elem in arrays_validation.clear_array('1 2.0')], [int, float])
+
+
+class TestParseNumber(unittest.TestCase):
+    def test_parse_number(self):
+        self.assertEqual(arrays_validation.parse_number(' 7 '), 7)
+        self.assertEqual(arrays_validation.parse_number('-0.5'), -0.5)
+        self.assertEqual(arrays_validation.parse_number('1e3'), 1000.0)
+
+        with self.assertRaises(ValueError):
+            arrays_validation.parse_number('abc')
+
+        with self.assertRaises(ValueError):
+            arrays_validation.parse_number('1' * 400 + '.5')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import http.client
+import math
+import random
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs
+
+from app import loadtest
+
+
+class TestParseMix(unittest.TestCase):
+    def test_parse_mix(self):
+        self.assertEqual(loadtest.parse_mix('main=4, add-array=0.5,process-arrays'),
+                         {'main': 4.0, 'add-array': 0.5, 'process-arrays': 1.0})
+        self.assertEqual(set(loadtest.parse_mix(loadtest.DEFAULT_MIX)), set(loadtest.ENDPOINTS))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            loadtest.parse_mix('admin=1')
+
+        with self.assertRaises(ValueError):
+            loadtest.parse_mix('main=0')
+
+
+class TestPercentile(unittest.TestCase):
+    def test_percentile(self):
+        values: list[float] = list(range(1, 101))
+
+        self.assertEqual(loadtest.percentile(values, 50), 50)
+        self.assertEqual(loadtest.percentile(values, 99), 99)
+        self.assertEqual(loadtest.percentile(values, 100), 100)
+        self.assertEqual(loadtest.percentile([5], 1), 5)
+        self.assertTrue(math.isnan(loadtest.percentile([], 50)))
+
+
+class TestRunResult(unittest.TestCase):
+    def setUp(self) -> None:
+        self.result = loadtest.RunResult('threaded', 'backend', duration=2)
+
+    def test_add(self):
+        self.result.add('main', 200, 0.01)
+        self.result.add('main', 500, 0.03)
+        self.result.add('add-array', 302, 0.02)
+        self.result.add('add-array', None, 1)
+
+        self.assertEqual(self.result.requests, 3)
+        self.assertEqual(self.result.errors, 2)
+        self.assertEqual(self.result.throughput, 1.5)
+        self.assertEqual(self.result.summary('main')['p99'], 30)
+        self.assertEqual(self.result.summary()['p50'], 20)
+        self.assertEqual(self.result.summary('main')['errors'], 1)
+        self.assertEqual(self.result.summary('add-array')['errors'], 1)
+
+    def test_merge(self):
+        other = loadtest.RunResult('', '', duration=2)
+        other.add('main', 200, 0.01)
+        self.result.add('main', 200, 0.02)
+
+        self.result.merge(other)
+
+        self.assertEqual(self.result.latencies, {'main': [0.02, 0.01]})
+        self.assertEqual(self.result.statuses[200], 2)
+
+    def test_merge_errors(self):
+        other = loadtest.RunResult('', '', duration=2)
+        other.add('delete-array', 500, 0.01)
+        self.result.add('delete-array', None, 0.02)
+
+        self.result.merge(other)
+
+        self.assertEqual(self.result.endpoint_errors, {'delete-array': 2})
+        self.assertEqual(self.result.errors, 2)
+
+    def test_format_results(self):
+        self.result.add('main', 200, 0.01)
+        self.result.add('delete-array', None, 0.01)
+
+        lines: list[str] = loadtest.format_results([self.result])
+
+        self.assertEqual(len(lines), 4)
+        self.assertIn('all', lines[1])
+        self.assertIn('main', lines[2])
+        self.assertEqual(lines[3].split()[2:], ['delete-array', '0', '0.0', 'nan', 'nan', 'nan', '1'])
+
+
+class TestClient(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = loadtest.Client('127.0.0.1', 8000, random.Random(0), elements=3)
+
+    def response(self, status: int, body: bytes = b'') -> MagicMock:
+        response = MagicMock(status=status)
+        response.read.return_value = body
+        return response
+
+    def test_get_request(self):
+        self.client.arrays = 2
+        for endpoint in loadtest.ENDPOINTS:
+            method, path, body = self.client.get_request(endpoint)
+
+            self.assertEqual(method == 'POST', body is not None)
+            self.assertEqual(path.strip('/').split('/')[0], '' if endpoint == 'main' else endpoint)
+
+    def test_array_str(self):
+        body: bytes = self.client.get_request('add-array')[2]
+
+        self.assertEqual(len(parse_qs(body.decode())['new-array'][0].split(',')), 3)
+
+    def test_known_arrays(self):
+        self.client.arrays = 2
+
+        self.assertIn(self.client.get_request('delete-array')[1], ('/delete-array/0', '/delete-array/1'))
+        self.assertEqual(len(parse_qs(self.client.get_request('save-changes')[2].decode())['array']), 2)
+
+    def test_update_arrays(self):
+        self.client.update_arrays('main', 200, b'<input name="array"><input name="array"><input name="new-array">')
+        self.assertEqual(self.client.arrays, 2)
+
+        self.client.update_arrays('add-array', 302, b'')
+        self.client.update_arrays('delete-array', 302, b'')
+        self.client.update_arrays('delete-array', 500, b'')
+        self.assertEqual(self.client.arrays, 2)
+
+    def test_nothing_to_delete(self):
+        self.client.connection = MagicMock()
+        self.client.connection.getresponse.return_value = self.response(302)
+
+        self.assertEqual(self.client.request('delete-array'), ('add-array', 302))
+        self.assertEqual(self.client.connection.request.call_args.args[:2], ('POST', '/add-array'))
+        self.assertEqual(self.client.arrays, 1)
+
+    def test_retry_get(self):
+        self.client.connection = MagicMock()
+        self.client.connection.getresponse.side_effect = [http.client.RemoteDisconnected(), self.response(200)]
+
+        self.assertEqual(self.client.request('main'), ('main', 200))
+        self.assertEqual(self.client.connection.request.call_count, 2)
+
+    def test_no_retry_post(self):
+        self.client.connection = MagicMock()
+        self.client.connection.getresponse.side_effect = [http.client.RemoteDisconnected(), self.response(302)]
+
+        self.assertEqual(self.client.request('add-array'), ('add-array', None))
+        self.assertEqual(self.client.connection.request.call_count, 1)
+
+
+class SlowLoginClient:
+    def __init__(self, host: str, port: int, random_: random.Random, elements: int):
+        self.random: random.Random = random_
+
+    def login(self) -> None:
+        time.sleep(0.3)
+
+    def request(self, endpoint: str) -> tuple[str, int]:
+        time.sleep(0.01)
+        return endpoint, 200
+
+
+class TestRunClients(unittest.TestCase):
+    @patch('app.loadtest.Client', SlowLoginClient)
+    def test_window_excludes_login(self):
+        result: loadtest.RunResult = loadtest.run_clients('127.0.0.1', 8000, {'main': 1}, clients=3, duration=0.2)
+
+        self.assertGreaterEqual(result.duration, 0.2)
+        self.assertLess(result.duration, 0.4)
+        self.assertGreater(result.requests, 3 * 5)
+
+
+class TestServerCommand(unittest.TestCase):
+    def test_wsgi(self):
+        self.assertEqual(loadtest.get_server_command('threaded', '127.0.0.1', 8000, 2)[-5:],
+                         ['serve', 'threaded', '127.0.0.1', '8000', '2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import tracemalloc
+import unittest
+
+from app import arrays, memprofile
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.profiler = memprofile.MemoryProfiler()
+        self.addCleanup(self.profiler.stop)
+
+    def test_disabled(self):
+        if tracemalloc.is_tracing():
+            self.skipTest('tracemalloc is already tracing')
+
+        with self.profiler.track('operation'):
+            pass
+
+        self.assertEqual(self.profiler.report(), {})
+
+    def test_track(self):
+        self.profiler.start()
+        kept: list = []
+
+        for _ in range(2):
+            with self.profiler.track('operation'):
+                kept.append(bytearray(100000))
+                bytearray(200000)
+
+        stats: dict = self.profiler.report()['operation']
+        self.assertEqual(stats['calls'], 2)
+        self.assertGreaterEqual(stats['peak'], 300000)
+        self.assertGreaterEqual(stats['retained'], 200000)
+        self.assertLess(stats['retained'], 300000)
+
+    def test_label_callable(self):
+        self.profiler.start()
+
+        with self.profiler.track(lambda: 'computed'):
+            pass
+
+        self.assertIn('computed', self.profiler.report())
+
+    def test_check(self):
+        self.profiler.record('small', peak=10, retained=10)
+        self.profiler.record('small', peak=20, retained=30)
+        self.profiler.record('big', peak=1000, retained=-10)
+
+        self.assertEqual(self.profiler.check(max_peak=100), ['big: peak 1000 B > 100 B'])
+        self.assertEqual(self.profiler.check(max_retained=15), ['small: retained 20 B per call > 15 B'])
+        self.assertEqual(self.profiler.check(max_retained=25), [])
+        self.assertEqual(self.profiler.check(), [])
+        self.assertEqual(self.profiler.report()['small'], {'calls': 2, 'peak': 20, 'retained': 40,
+                                                           'retained_per_call': 20.0})
+
+    def test_top_sites(self):
+        self.profiler.start()
+        kept: bytearray = bytearray(1000000)
+
+        site: tracemalloc.Statistic = self.profiler.top_sites(1)[0]
+
+        self.assertEqual(site.traceback[0].filename, __file__)
+        self.assertGreaterEqual(site.size, len(kept))
+
+
+class TestReplayWorkload(unittest.TestCase):
+    # Ten int8 elements and the TypedArray around them, measured about 145 bytes against about 325 bytes of list
+    MAX_BYTES_PER_TYPED_ARRAY: int = 160
+
+    def setUp(self) -> None:
+        self.profiler = memprofile.MemoryProfiler()
+        self.addCleanup(self.profiler.stop)
+
+    def test_replay(self):
+        manager = arrays.TypedArraysManager()
+
+        self.profiler.start()
+        memprofile.replay_workload(manager, self.profiler, arrays_count=100, rounds=2)
+
+        report: dict = self.profiler.report()
+        self.assertEqual(set(report), {'clear_array', 'add_array', 'update', 'get_arrays_with_max_elems_sum',
+                                       'process_arrays', 'delete'})
+        self.assertEqual(report['add_array']['calls'], 2)
+        self.assertEqual(manager.objects, [])
+
+    def test_keep_last(self):
+        manager = arrays.TypedArraysManager()
+
+        memprofile.replay_workload(manager, self.profiler, arrays_count=10, rounds=2, keep_last=True)
+
+        self.assertEqual(len(manager.objects), 10)
+
+    def test_typed_arrays_memory(self):
+        self.profiler.start()
+        memprofile.replay_workload(arrays.TypedArraysManager(), self.profiler, arrays_count=500, rounds=1,
+                                   keep_last=True)
+
+        retained: int = self.profiler.report()['add_array']['retained']
+        self.assertLess(retained / 500, self.MAX_BYTES_PER_TYPED_ARRAY)
+
+    def test_parsing_retains_nothing(self):
+        self.profiler.start()
+        # The first run also retains one-off allocations of module and regex caches
+        memprofile.replay_workload(arrays.ArraysManager(), self.profiler, arrays_count=500, rounds=1)
+        self.profiler.reset()
+        memprofile.replay_workload(arrays.ArraysManager(), self.profiler, arrays_count=500, rounds=1, seed=1)
+
+        # Parsed arrays take about 300 bytes each, what remains after they are freed is allocator noise
+        retained: int = self.profiler.report()['clear_array']['retained']
+        self.assertLess(retained / 500, 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from app import startup
+
+
+IMPORTTIME_OUTPUT: str = '''import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        50 |         50 |     marshal
+import time:       300 |        470 | project.wsgi
+Traceback-like noise
+import time:        10 |         10 | app
+'''
+
+
+class TestParseImporttime(unittest.TestCase):
+    def test_parse(self):
+        records: list[startup.ImportRecord] = startup.parse_importtime(IMPORTTIME_OUTPUT)
+
+        self.assertEqual([record.module for record in records], ['_io', 'marshal', 'project.wsgi', 'app'])
+        self.assertEqual([record.depth for record in records], [1, 2, 0, 0])
+        self.assertEqual(records[2].self_us, 300)
+        self.assertEqual(records[2].cumulative_us, 470)
+
+    def test_report(self):
+        report = startup.StartupReport('project.settings', 'project.wsgi',
+                                       startup.parse_importtime(IMPORTTIME_OUTPUT))
+
+        self.assertEqual(report.total_us, 480)
+        self.assertEqual(report.modules_count, 4)
+        self.assertEqual(report.slowest(1)[0].module, 'project.wsgi')
+
+
+class TestMeasureStartup(unittest.TestCase):
+    @patch('subprocess.run')
+    def test_readiness(self, run_mock: MagicMock):
+        run_mock.return_value = MagicMock(returncode=0, stderr=IMPORTTIME_OUTPUT)
+
+        startup.measure_startup('project.settings')
+        code: str = run_mock.call_args.args[0][-1]
+
+        self.assertTrue(code.startswith('import project.wsgi'))
+        self.assertIn('get_resolver().url_patterns', code)
+
+        startup.measure_startup('project.settings', import_only=True)
+
+        self.assertEqual(run_mock.call_args.args[0][-1], 'import project.wsgi')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import struct
+import unittest
+
+from app import typed_arrays
+
+
+class TestInferDtype(unittest.TestCase):
+    def test_infer_dtype(self):
+        self.assertEqual(typed_arrays.infer_dtype([]), 'int8')
+        self.assertEqual(typed_arrays.infer_dtype([-128, 127]), 'int8')
+        self.assertEqual(typed_arrays.infer_dtype([128]), 'int16')
+        self.assertEqual(typed_arrays.infer_dtype([-2 ** 31]), 'int32')
+        self.assertEqual(typed_arrays.infer_dtype([2 ** 31]), 'int64')
+        self.assertEqual(typed_arrays.infer_dtype([2 ** 63]), 'float64')
+        self.assertEqual(typed_arrays.infer_dtype([1, 2.0]), 'float64')
+
+    def test_minimum(self):
+        self.assertEqual(typed_arrays.infer_dtype([1], minimum='int32'), 'int32')
+        self.assertEqual(typed_arrays.infer_dtype([1], minimum='float64'), 'float64')
+
+    def test_out_of_range(self):
+        self.assertEqual(typed_arrays.infer_dtype([10 ** 300]), 'float64')
+
+        with self.assertRaises(ValueError):
+            typed_arrays.infer_dtype([10 ** 400])
+
+        with self.assertRaises(ValueError):
+            typed_arrays.TypedArray([1]).append(-10 ** 400)
+
+    def test_not_numbers(self):
+        with self.assertRaises(ValueError):
+            typed_arrays.infer_dtype(['1'])
+
+
+class TestTypedArray(unittest.TestCase):
+    def test_init(self):
+        array = typed_arrays.TypedArray([1, -2, 3])
+
+        self.assertEqual(array, [1, -2, 3])
+        self.assertEqual(array.dtype, 'int8')
+        self.assertEqual(array.nbytes, 3)
+        self.assertEqual(typed_arrays.TypedArray([1, 2], dtype='int64').nbytes, 16)
+
+    def test_upgrade(self):
+        array = typed_arrays.TypedArray([1, 2])
+
+        array.append(1000)
+        self.assertEqual(array.dtype, 'int16')
+
+        array[0] = 2 ** 40
+        self.assertEqual(array.dtype, 'int64')
+
+        array.insert(0, 0.5)
+        self.assertEqual(array.dtype, 'float64')
+        self.assertEqual(array, [0.5, 2 ** 40, 2, 1000])
+
+        array.append(1)
+        self.assertEqual(array.dtype, 'float64')
+
+    def test_slices(self):
+        array = typed_arrays.TypedArray([1, 2, 3, 4])
+
+        self.assertEqual(array[1:3], [2, 3])
+        self.assertIsInstance(array[1:3], typed_arrays.TypedArray)
+
+        array[:2] = [300]
+        self.assertEqual(array, [300, 3, 4])
+        self.assertEqual(array.dtype, 'int16')
+
+        del array[0]
+        self.assertEqual(array, [3, 4])
+
+    def test_remove(self):
+        array = typed_arrays.TypedArray([0, 1, 0, 2])
+
+        while 0 in array:
+            array.remove(0)
+
+        self.assertEqual(array, [1, 2])
+
+        with self.assertRaises(ValueError):
+            array.remove(0)
+
+    def test_sum(self):
+        self.assertEqual(typed_arrays.TypedArray([100, 100, 100]).sum(), 300)
+        self.assertEqual(typed_arrays.TypedArray([0.1] * 10).sum(), 1.0)
+
+    def test_sort(self):
+        arrays: list[list] = [
+            [3, -128, 127, 0, -1, 3],
+            [1000, -5, 20],
+            [2.5, -1.5, 0.0],
+            [],
+        ]
+
+        for values in arrays:
+            array = typed_arrays.TypedArray(values)
+            array.sort()
+            self.assertEqual(array, sorted(values))
+
+            array.sort(reverse=True)
+            self.assertEqual(array, sorted(values, reverse=True))
+
+        array = typed_arrays.TypedArray([3, 1])
+        array.sort()
+        self.assertEqual(array.dtype, 'int8')
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            typed_arrays.TypedArray().attribute = 1
+
+    def test_little_endian(self):
+        array = typed_arrays.TypedArray([2 ** 53 + 1, -2])
+
+        self.assertEqual(array.little_endian_view().tobytes(), struct.pack('<2q', 2 ** 53 + 1, -2))
+        self.assertEqual(typed_arrays.TypedArray.from_little_endian(struct.pack('<2h', 300, -1), 'int16'), [300, -1])
+
+    def test_str(self):
+        self.assertEqual(str(typed_arrays.TypedArray([1, 2])), '[1, 2]')
+
+
+if __name__ == '__main__':
+    unittest.main()
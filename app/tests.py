@@ -1,3 +1,272 @@
-from django.test import TestCase
+import gzip
+import json
+import os
+import struct
+import subprocess
+import sys
+from unittest.mock import patch
 
-class
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import resolve, reverse
+
+from app import arrays
+from app.admission import Admission, RateLimiter
+from app.api_encoding import MsgpackCodec, RawCodec
+from app.memprofile import MemoryProfiler
+from app.middleware import MemoryProfilingMiddleware
+from app.views import ADMISSION
+
+
+class TestApi(SimpleTestCase):
+    def setUp(self) -> None:
+        self.manager = arrays.TypedArraysManager()
+        for patcher in (patch('app.api.ARRAY_MANAGER', self.manager), patch('app.views.ARRAY_MANAGER', self.manager),
+                        patch.object(ADMISSION, 'limiter', RateLimiter(rate=1000, capacity=1000))):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def post_json(self, url: str, data, **extra):
+        return self.client.post(url, json.dumps(data), content_type='application/json', **extra)
+
+    def test_list(self):
+        self.manager.create([1, 2])
+
+        response = self.client.get(reverse('api-arrays'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'arrays': [{'id': 0, 'array': [1, 2], 'dtype': 'int8', 'nbytes': 2}]})
+
+    def test_create(self):
+        response = self.post_json(reverse('api-arrays'), {'array': [3, 1.5]})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {'id': 0, 'array': [3.0, 1.5], 'dtype': 'float64', 'nbytes': 16})
+        self.assertEqual(self.manager.objects, [[3, 1.5]])
+
+        for array in (['1'], [], [True], [float('inf')]):
+            response = self.post_json(reverse('api-arrays'), {'array': array})
+
+            self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(reverse('api-arrays'), '{"array": [NaN]}', content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.manager.objects, [[3, 1.5]])
+
+    def test_detail(self):
+        self.manager.create([1, 2])
+
+        self.assertEqual(self.client.get(reverse('api-array', args=[0])).json(),
+                         {'id': 0, 'array': [1, 2], 'dtype': 'int8', 'nbytes': 2})
+        self.assertEqual(self.client.get(reverse('api-array', args=[1])).status_code, 404)
+
+        response = self.client.put(reverse('api-array', args=[0]), json.dumps({'array': [5]}),
+                                   content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.manager.objects, [[5]])
+
+        response = self.client.delete(reverse('api-array', args=[0]))
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.manager.objects, [])
+
+    def test_process(self):
+        self.manager.create([3, 1, 2])
+        self.manager.create([0, 0, 2])
+
+        response = self.client.post(reverse('api-process'), content_type='application/json')
+
+        self.assertEqual(response.json()['arrays'][0]['array'], [1, 2, 3])
+
+    def test_process_empty(self):
+        self.manager.create([1])
+        self.manager.create([])
+
+        response = self.client.post(reverse('api-process'), content_type='application/json')
+
+        self.assertEqual(response.status_code, 409)
+
+    def test_batch(self):
+        response = self.post_json(reverse('api-batch'), {'operations': [
+            {'op': 'create', 'array': [1]},
+            {'op': 'get', 'id': 5},
+            {'op': 'unknown'},
+            {'op': 'list'},
+        ]})
+
+        results: list[dict] = response.json()['results']
+        self.assertEqual([result['status'] for result in results], [201, 404, 400, 200])
+        self.assertEqual(results[3]['body'], {'arrays': [{'id': 0, 'array': [1], 'dtype': 'int8', 'nbytes': 1}]})
+
+    def test_batch_single_process(self):
+        self.manager.create([1, 0])
+
+        response = self.post_json(reverse('api-batch'), {'operations': [{'op': 'process'}] * 50})
+
+        self.assertEqual([result['status'] for result in response.json()['results']], [200] + [400] * 49)
+
+    def test_batch_raw_not_acceptable(self):
+        response = self.post_json(reverse('api-batch'), {'operations': [{'op': 'create', 'array': [1]}]},
+                                  HTTP_ACCEPT='application/octet-stream')
+
+        self.assertEqual(response.status_code, 406)
+        self.assertEqual(self.manager.objects, [])
+
+    def test_msgpack(self):
+        codec: MsgpackCodec = MsgpackCodec()
+
+        response = self.client.post(reverse('api-arrays'), codec.encode({'array': [1, -2]}),
+                                    content_type='application/msgpack', HTTP_ACCEPT='application/msgpack')
+
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(codec.decode(response.content), {'id': 0, 'array': [1, -2], 'dtype': 'int8', 'nbytes': 2})
+
+    def test_raw(self):
+        self.manager.create([2 ** 53 + 1, 2])
+
+        response = self.client.get(reverse('api-array', args=[0]), HTTP_ACCEPT='application/octet-stream')
+
+        self.assertEqual(response.content, struct.pack('<IBI2q', 1, 3, 2, 2 ** 53 + 1, 2))
+
+    def test_raw_create(self):
+        body: bytes = RawCodec().encode({'array': [1e300, 2.0]})
+
+        response = self.client.post(reverse('api-arrays'), body, content_type='application/octet-stream')
+
+        self.assertEqual(response.json()['array'], [1e300, 2.0])
+        self.assertEqual(response.json()['dtype'], 'float64')
+
+    def test_gzip(self):
+        self.manager.create(list(range(1000)))
+
+        response = self.client.get(reverse('api-arrays'), HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(response.content))['arrays'][0]['array'], list(range(1000)))
+
+    def test_errors(self):
+        self.assertEqual(self.client.get(reverse('api-arrays'), HTTP_ACCEPT='text/html').status_code, 406)
+        self.assertEqual(self.client.post(reverse('api-arrays'), 'x', content_type='text/plain').status_code, 415)
+        self.assertEqual(self.client.post(reverse('api-arrays'), '{', content_type='application/json').status_code,
+                         400)
+        self.assertEqual(self.client.get(reverse('api-process')).status_code, 405)
+
+
+class TestAdmission(SimpleTestCase):
+    def setUp(self) -> None:
+        self.manager = arrays.TypedArraysManager()
+        for patcher in (patch('app.api.ARRAY_MANAGER', self.manager), patch('app.views.ARRAY_MANAGER', self.manager)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # Views are decorated with methods of the ADMISSION instance, so its state is patched instead of it
+        self.admission = Admission(rate=1, burst=2, max_body_size=100, max_elements=3, max_batch_operations=3)
+        for attribute in ('limiter', 'max_body_size', 'max_elements', 'max_batch_operations', 'counters', 'coalescer'):
+            patcher = patch.object(ADMISSION, attribute, getattr(self.admission, attribute))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_rate_limit(self):
+        statuses: list[int] = [
+            self.client.get(reverse('process-arrays'), HTTP_REFERER='/').status_code for _ in range(3)
+        ]
+
+        self.assertEqual(statuses, [302, 302, 429])
+        self.assertEqual(self.client.post(reverse('api-process'), content_type='application/json').status_code, 429)
+        self.assertEqual(self.client.get(reverse('api-arrays')).status_code, 429)
+        self.assertEqual(self.admission.counters.snapshot()['rate_limited'], 3)
+        self.assertEqual(self.admission.counters.snapshot()['executed_process_arrays'], 2)
+
+    def test_body_size(self):
+        response = self.client.post(reverse('add-array'), {'new-array': '1' * 200}, HTTP_REFERER='/')
+
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(self.manager.objects, [])
+
+    def test_decompressed_body_size(self):
+        body: bytes = gzip.compress(json.dumps({'array': [0] * 1000}).encode())
+        response = self.client.post(reverse('api-arrays'), body, content_type='application/json',
+                                    HTTP_CONTENT_ENCODING='gzip')
+
+        self.assertLessEqual(len(body), 100)
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(self.admission.counters.snapshot()['body_too_large'], 1)
+        self.assertEqual(self.manager.objects, [])
+
+    @override_settings(ARRAYS_RATE_LIMIT=0)
+    def test_zero_rate(self):
+        with self.assertRaises(ImproperlyConfigured):
+            Admission.from_settings()
+
+    def test_max_batch_operations(self):
+        response = self.client.post(reverse('api-batch'), json.dumps({'operations': [{'op': 'process'}] * 4}),
+                                    content_type='application/json')
+
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(self.admission.counters.snapshot()['too_many_operations'], 1)
+        self.assertNotIn('executed_process_arrays', self.admission.counters.snapshot())
+
+    def test_max_elements(self):
+        self.client.post(reverse('add-array'), {'new-array': '1 2 3 4'}, HTTP_REFERER='/')
+        response = self.client.post(reverse('api-arrays'), json.dumps({'array': [1, 2, 3, 4]}),
+                                    content_type='application/json')
+
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(self.manager.objects, [])
+        self.assertEqual(self.client.get(reverse('api-admission')).json()['counters']['too_many_elements'], 2)
+
+
+class TestMemoryProfiling(SimpleTestCase):
+    def setUp(self) -> None:
+        self.profiler = MemoryProfiler()
+        self.addCleanup(self.profiler.stop)
+        patcher = patch('app.memprofile.PROFILER', self.profiler)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(ARRAYS_MEMORY_PROFILING=False)
+    def test_off(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            MemoryProfilingMiddleware(lambda request: HttpResponse())
+
+        self.assertEqual(self.client.get(reverse('api-memory')).status_code, 404)
+
+    def test_off_not_imported(self):
+        code: str = ('import sys, django; django.setup(); from django.core.handlers.wsgi import WSGIHandler; '
+                     'from django.urls import get_resolver; WSGIHandler(); get_resolver().url_patterns; '
+                     'print(sorted({"app.memprofile", "tracemalloc"} & sys.modules.keys()))')
+        env: dict = dict(os.environ, DJANGO_SETTINGS_MODULE='project.settings_lean', ARRAYS_MEMORY_PROFILING='0')
+        env.setdefault('DjangoSecretKeyLaba1', 'test')
+
+        output: str = subprocess.run([sys.executable, '-c', code], env=env, cwd=settings.BASE_DIR,
+                                     capture_output=True, text=True, check=True).stdout
+
+        self.assertEqual(output.strip(), '[]')
+
+    @override_settings(ARRAYS_MEMORY_PROFILING=True)
+    def test_middleware(self):
+        middleware = MemoryProfilingMiddleware(lambda request: HttpResponse())
+        request = RequestFactory().get(reverse('api-arrays'))
+        request.resolver_match = resolve(reverse('api-arrays'))
+
+        middleware(request)
+
+        self.assertEqual(self.client.get(reverse('api-memory')).json()['operations']['view:api-arrays']['calls'], 1)
+
+
+class TestArraysTemplate(SimpleTestCase):
+    @override_settings(ALLOWED_HOSTS=['testserver'])
+    def test_dtype(self):
+        for manager, expected in ((arrays.TypedArraysManager(), 'int8, 2 B'), (arrays.ArraysManager(), None)):
+            manager.create([1, 2])
+            with patch('app.views.ARRAY_MANAGER', manager):
+                content: str = self.client.get(reverse('main')).content.decode()
+
+            if expected:
+                self.assertIn(expected, content)
+            else:
+                self.assertNotIn(' B</span>', content)
@@ -0,0 +1,193 @@
+import math
+import sys
+from array import array
+from collections import Counter
+from collections.abc import MutableSequence
+from numbers import Number
+from typing import Iterable, Iterator
+
+
+def _int_typecode(itemsize: int) -> str:
+    return next(code for code in 'bhilq' if array(code).itemsize == itemsize)
+
+
+DTYPES: dict[str, str] = {
+    'int8': _int_typecode(1),
+    'int16': _int_typecode(2),
+    'int32': _int_typecode(4),
+    'int64': _int_typecode(8),
+    'float64': 'd',
+}
+
+INT_RANGES: dict[str, tuple[int, int]] = {
+    name: (-(1 << (8 * array(code).itemsize - 1)), (1 << (8 * array(code).itemsize - 1)) - 1)
+    for name, code in DTYPES.items() if name != 'float64'
+}
+
+# Flips sign bit, so unsigned order of int8 bytes matches signed order of their values
+_INT8_ORDER: bytes = bytes(i ^ 0x80 for i in range(256))
+
+
+def infer_dtype(values: Iterable[Number], minimum: str = 'int8') -> str:
+    """Narrowest dtype that can hold all values and is not narrower than ``minimum``"""
+    values = values if isinstance(values, (list, tuple, array)) else list(values)
+    if not all(isinstance(value, Number) for value in values):
+        raise ValueError('Array elements must be numbers')
+
+    if minimum == 'float64' or any(isinstance(value, float) for value in values):
+        return 'float64'
+
+    low: int = min(values, default=0)
+    high: int = max(values, default=0)
+    names: list[str] = list(INT_RANGES)
+    for name in names[names.index(minimum):]:
+        min_value, max_value = INT_RANGES[name]
+        if min_value <= low and high <= max_value:
+            return name
+
+    # Python ints wider than int64 can only be approximated, while the widest ones do not fit even float64
+    try:
+        float(low), float(high)
+    except OverflowError:
+        raise ValueError('Array elements are too large')
+    return 'float64'
+
+
+class TypedArray(MutableSequence):
+    """
+    List-like array of numbers stored in the narrowest dtype from int8 to int64 or float64.
+    Dtype is upgraded automatically when a new value does not fit, but never downgraded
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, values: Iterable[Number] = (), dtype: str | None = None):
+        values = values if isinstance(values, (list, tuple, array)) else list(values)
+        dtype = dtype or infer_dtype(values)
+        self._data: array = array(DTYPES[dtype], self._cast(values, dtype))
+
+    @classmethod
+    def _from_array(cls, data: array) -> 'TypedArray':
+        instance: TypedArray = cls.__new__(cls)
+        instance._data = data
+        return instance
+
+    @classmethod
+    def from_little_endian(cls, data: bytes, dtype: str) -> 'TypedArray':
+        values: array = array(DTYPES[dtype])
+        values.frombytes(data)
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return cls._from_array(values)
+
+    def little_endian_view(self) -> memoryview:
+        """Elements as little-endian bytes, copied only on big-endian platforms"""
+        if sys.byteorder == 'little':
+            return memoryview(self._data).cast('B')
+
+        values: array = array(self._data.typecode, self._data)
+        values.byteswap()
+        return memoryview(values).cast('B')
+
+    @staticmethod
+    def _cast(values: Iterable[Number], dtype: str) -> Iterable[Number]:
+        return map(float, values) if dtype == 'float64' else values
+
+    @property
+    def dtype(self) -> str:
+        return next(name for name, code in DTYPES.items() if code == self._data.typecode)
+
+    @property
+    def itemsize(self) -> int:
+        return self._data.itemsize
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.itemsize * len(self._data)
+
+    def _ensure_fits(self, values: Iterable[Number]) -> str:
+        dtype: str = infer_dtype(values, minimum=self.dtype)
+        if dtype != self.dtype:
+            self._data = array(DTYPES[dtype], self._cast(self._data, dtype))
+        return dtype
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Number]:
+        return iter(self._data)
+
+    def __contains__(self, value) -> bool:
+        return value in self._data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_array(self._data[index])
+        return self._data[index]
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            values: list = list(value)
+            dtype: str = self._ensure_fits(values)
+            self._data[index] = array(DTYPES[dtype], self._cast(values, dtype))
+        else:
+            dtype: str = self._ensure_fits((value,))
+            self._data[index] = float(value) if dtype == 'float64' else value
+
+    def __delitem__(self, index) -> None:
+        del self._data[index]
+
+    def insert(self, index: int, value: Number) -> None:
+        dtype: str = self._ensure_fits((value,))
+        self._data.insert(index, float(value) if dtype == 'float64' else value)
+
+    def append(self, value: Number) -> None:
+        self.insert(len(self._data), value)
+
+    def extend(self, values: Iterable[Number]) -> None:
+        values = list(values)
+        dtype: str = self._ensure_fits(values)
+        self._data.extend(self._cast(values, dtype))
+
+    def index(self, value, start: int = 0, stop: int | None = None) -> int:
+        return self._data.index(value, start, len(self._data) if stop is None else stop)
+
+    def count(self, value) -> int:
+        return self._data.count(value)
+
+    def remove(self, value) -> None:
+        self._data.remove(value)
+
+    def sum(self) -> Number:
+        if self.dtype == 'float64':
+            return math.fsum(self._data)
+        return sum(self._data)
+
+    def sort(self, reverse: bool = False) -> None:
+        if self.dtype == 'int8':
+            self._counting_sort()
+        else:
+            self._data = array(self._data.typecode, sorted(self._data))
+
+        if reverse:
+            self._data.reverse()
+
+    def _counting_sort(self) -> None:
+        counts: Counter = Counter(self._data.tobytes().translate(_INT8_ORDER))
+        ordered: bytes = b''.join(bytes((byte,)) * counts[byte] for byte in sorted(counts))
+
+        self._data = array(self._data.typecode)
+        self._data.frombytes(ordered.translate(_INT8_ORDER))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TypedArray):
+            return self._data == other._data
+        if isinstance(other, (list, tuple)):
+            return list(self._data) == list(other)
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return str(self._data.tolist())
+
+    def __repr__(self) -> str:
+        return f'TypedArray({self._data.tolist()}, dtype={self.dtype!r})'
@@ -1,6 +1,6 @@
 from django.urls import path, include
 
-from . import views
+from . import api, views
 
 
 urlpatterns = [
@@ -9,4 +9,10 @@ urlpatterns = [
     path('delete-array/<int:array_id>', views.delete_array, name='delete-array'),
     path('process-arrays', views.process_arrays, name='process-arrays'),
     path('save-changes', views.save_changes, name='save-changes'),
+    path('api/arrays', api.arrays_list, name='api-arrays'),
+    path('api/arrays/<int:id>', api.array_detail, name='api-array'),
+    path('api/process', api.process, name='api-process'),
+    path('api/batch', api.batch, name='api-batch'),
+    path('api/admission', api.admission, name='api-admission'),
+    path('api/memory', api.memory, name='api-memory'),
 ]
@@ -1,11 +1,17 @@
+from django.conf import settings
 from django.http import HttpRequest
 from django.shortcuts import render, redirect
+from django.utils.module_loading import import_string
 
 from . import arrays
-from .arrays_validation import clear_array
+from .admission import Admission
+from .arrays_validation import clear_array, TooManyElements
 
 
-ARRAY_MANAGER: arrays.ArraysManager = arrays.ArraysManager()
+ARRAY_MANAGER: arrays.ArraysManager = import_string(
+    getattr(settings, 'ARRAYS_MANAGER_BACKEND', 'app.arrays.TypedArraysManager')
+)()
+ADMISSION: Admission = Admission.from_settings()
 
 
 def no_redirect(function):
@@ -16,6 +22,10 @@ def no_redirect(function):
     return wrapper
 
 
+def run_process_arrays() -> None:
+    ADMISSION.coalesce('process_arrays', lambda: arrays.ProcessArrays()(arrays_manager=ARRAY_MANAGER))
+
+
 def main(request: HttpRequest):
     context: dict = {
         'arrays': ARRAY_MANAGER.objects,
@@ -23,12 +33,16 @@ def main(request: HttpRequest):
     return render(request, 'app/main.html', context)
 
 
+@ADMISSION.rate_limited
+@ADMISSION.body_limited
 @no_redirect
 def add_array(request: HttpRequest):
     array: str = request.POST.get('new-array', None)
     try:
-        array: list[int | float] = clear_array(array)
+        array: list[int | float] = clear_array(array, max_elements=ADMISSION.max_elements)
         ARRAY_MANAGER.create(array)
+    except TooManyElements:
+        ADMISSION.counters.increment('too_many_elements')
     except ValueError:
         pass
 
@@ -38,16 +52,21 @@ def delete_array(request: HttpRequest, array_id: int):
     ARRAY_MANAGER.delete(array_id)
 
 
+@ADMISSION.rate_limited
 @no_redirect
 def process_arrays(request: HttpRequest):
-    arrays.ProcessArrays()(arrays_manager=ARRAY_MANAGER)
+    run_process_arrays()
 
 
+@ADMISSION.rate_limited
+@ADMISSION.body_limited
 @no_redirect
 def save_changes(request: HttpRequest):
     for i, array_str in enumerate(request.POST.getlist('array', None)):
         try:
-            array: list[int | float] = clear_array(array_str)
-            ARRAY_MANAGER.objects[i] = array
+            array: list[int | float] = clear_array(array_str, max_elements=ADMISSION.max_elements)
+            ARRAY_MANAGER.update(i, array)
+        except TooManyElements:
+            ADMISSION.counters.increment('too_many_elements')
         except ValueError:
             pass
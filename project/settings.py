@@ -48,6 +48,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'app.middleware.MemoryProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'project.urls'
@@ -118,6 +119,30 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Arrays storage, app.arrays.ArraysManager keeps plain lists
+
+ARRAYS_MANAGER_BACKEND = os.getenv('ARRAYS_MANAGER_BACKEND', 'app.arrays.TypedArraysManager')
+
+
+# Admission limits of the arrays views, see app/admission.py
+
+ARRAYS_RATE_LIMIT = float(os.getenv('ARRAYS_RATE_LIMIT', 5))  # Requests per second per client to the expensive views
+
+ARRAYS_RATE_BURST = float(os.getenv('ARRAYS_RATE_BURST', 20))
+
+ARRAYS_MAX_BODY_SIZE = 64 * 1024
+
+ARRAYS_MAX_ELEMENTS = 10000
+
+ARRAYS_MAX_BATCH_OPERATIONS = 100
+
+DATA_UPLOAD_MAX_MEMORY_SIZE = ARRAYS_MAX_BODY_SIZE
+
+# Tracks allocations of every view with tracemalloc, see app/memprofile.py. Slows requests down noticeably
+
+ARRAYS_MEMORY_PROFILING = os.getenv('ARRAYS_MEMORY_PROFILING') == '1'
+
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.0/ref/settings/#default-auto-field
 
@@ -0,0 +1,44 @@
+"""
+Lean Django settings for project project.
+
+Boots only what the arrays app needs: no admin, auth, sessions, messages or database.
+Use it for serverless or autoscaled workers where cold start time matters:
+
+    DJANGO_SETTINGS_MODULE=project.settings_lean
+
+Run ``python manage.py startuptime`` to compare it with ``project.settings``.
+"""
+from .settings import *  # noqa: F401,F403
+
+
+INSTALLED_APPS = [
+    'app',
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'app.middleware.MemoryProfilingMiddleware',
+]
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+            ],
+        },
+    },
+]
+
+# The app keeps arrays in memory and has no models
+DATABASES = {}
+
+AUTH_PASSWORD_VALIDATORS = []
+
+USE_I18N = False